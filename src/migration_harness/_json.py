@@ -0,0 +1,54 @@
+"""JSON encoding and decoding shared by config loading, hooks and state persistence.
+
+Uses orjson when it is installed (``pip install migration-harness[fast]``)
+and falls back to pydantic-core's parser, which ships with pydantic.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    _loads = orjson.loads
+else:  # pragma: no cover - depends on the environment
+    from pydantic_core import from_json as _loads
+    from pydantic_core import to_json as _to_json
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes.
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        ValueError: If the input is not valid JSON.
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as JSON.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with a two-space indent.
+
+    Returns:
+        UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If the object is not JSON-serializable (orjson).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return _to_json(obj, indent=2 if indent else None)  # pragma: no cover
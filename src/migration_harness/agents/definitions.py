@@ -1,5 +1,7 @@
 """Agent definitions and configurations for each phase."""
 
+from typing import NamedTuple
+
 from migration_harness.agents.prompts import (
     DISCOVERY_SYSTEM_PROMPT,
     GENERATION_SYSTEM_PROMPT,
@@ -10,16 +12,43 @@ from migration_harness.agents.prompts import (
 from migration_harness.schema import Config
 
 
-class AgentDefinitions:
-    """Factory for creating agent configurations per phase."""
+class _AgentDefinitionsFields(NamedTuple):
+    config: Config
+    discovery: str
+    narrowing: str
+    generation: str
+    migration: str
+    validation: str
+    model: str
+    max_turns: int
+
+
+class AgentDefinitions(_AgentDefinitionsFields):
+    """Factory for creating agent configurations per phase.
+
+    Prompts, model and turn limit are resolved once from the config and
+    stored as immutable tuple fields; the ``get_*`` methods read them back.
+    """
+
+    __slots__ = ()
 
-    def __init__(self, config: Config):
-        """Initialize agent definitions.
+    def __new__(cls, config: Config) -> "AgentDefinitions":
+        """Build agent definitions from a config.
 
         Args:
             config: Migration configuration.
         """
-        self.config = config
+        return super().__new__(
+            cls,
+            config,
+            DISCOVERY_SYSTEM_PROMPT,
+            NARROWING_SYSTEM_PROMPT,
+            GENERATION_SYSTEM_PROMPT,
+            MIGRATION_SYSTEM_PROMPT,
+            VALIDATION_SYSTEM_PROMPT,
+            config.options.model,
+            config.options.max_turns_per_phase,
+        )
 
     def get_discovery_prompt(self) -> str:
         """Get discovery phase system prompt.
@@ -27,7 +56,7 @@ class AgentDefinitions:
         Returns:
             System prompt for discovery agent.
         """
-        return DISCOVERY_SYSTEM_PROMPT
+        return self.discovery
 
     def get_narrowing_prompt(self) -> str:
         """Get narrowing phase system prompt.
@@ -35,7 +64,7 @@ class AgentDefinitions:
         Returns:
             System prompt for narrowing agent.
         """
-        return NARROWING_SYSTEM_PROMPT
+        return self.narrowing
 
     def get_generation_prompt(self) -> str:
         """Get generation phase system prompt.
@@ -43,7 +72,7 @@ class AgentDefinitions:
         Returns:
             System prompt for generation agent.
         """
-        return GENERATION_SYSTEM_PROMPT
+        return self.generation
 
     def get_migration_prompt(self) -> str:
         """Get migration phase system prompt.
@@ -51,7 +80,7 @@ class AgentDefinitions:
         Returns:
             System prompt for migration agent.
         """
-        return MIGRATION_SYSTEM_PROMPT
+        return self.migration
 
     def get_validation_prompt(self) -> str:
         """Get validation phase system prompt.
@@ -59,7 +88,7 @@ class AgentDefinitions:
         Returns:
             System prompt for validation agent.
         """
-        return VALIDATION_SYSTEM_PROMPT
+        return self.validation
 
     def get_model(self) -> str:
         """Get configured Claude model.
@@ -67,7 +96,7 @@ class AgentDefinitions:
         Returns:
             Model name (e.g., 'claude-sonnet-4-5-20250929').
         """
-        return self.config.options.model
+        return self.model
 
     def get_max_turns(self) -> int:
         """Get max agent turns per phase.
@@ -75,4 +104,4 @@ class AgentDefinitions:
         Returns:
             Maximum number of agent turns.
         """
-        return self.config.options.max_turns_per_phase
+        return self.max_turns
@@ -1,17 +1,25 @@
 """Configuration loading and validation."""
 
-import json
+import functools
+import os
 from pathlib import Path
 from typing import Any, Dict, Union
 
 from migration_harness.schema import Config
 
 
-def load_config(config_source: Union[str, Dict[str, Any]]) -> Config:
+def load_config(
+    config_source: Union[str, "os.PathLike[str]", bytes, bytearray, Dict[str, Any]],
+) -> Config:
     """Load and validate migration configuration.
 
+    File contents are cached on ``(path, mtime, size)``, so repeated loads
+    of an unchanged file skip the read. JSON input is parsed and validated
+    in a single pass, and each call returns a new Config.
+
     Args:
-        config_source: Either a file path (str) or a dict with configuration.
+        config_source: A file path (str or path-like), the raw JSON document
+            as bytes, or a dict with configuration.
 
     Returns:
         Validated Config object.
@@ -20,17 +28,75 @@ def load_config(config_source: Union[str, Dict[str, Any]]) -> Config:
         FileNotFoundError: If config file path doesn't exist.
         ValueError: If configuration is invalid.
     """
-    if isinstance(config_source, str):
+    if isinstance(config_source, (bytes, bytearray)):
+        return _validate_json(bytes(config_source))
+
+    if isinstance(config_source, (str, os.PathLike)):
         # Try to load from file
         config_path = Path(config_source)
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {config_source}")
 
-        with open(config_path) as f:
-            config_dict = json.load(f)
-    else:
-        config_dict = config_source
+        # Only the immutable bytes are cached; every call validates its own
+        # Config, so callers never share the models' mutable lists
+        # abspath, not resolve(): the key only needs to be stable, and
+        # resolving symlinks costs more than the validation itself
+        data = _read_cached(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+        return _validate_json(data)
+
+    return _validate(config_source)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a config file.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: a modified file
+    produces a new key and is re-read.
+
+    Args:
+        path: Absolute path to the config file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Raw file contents.
+    """
+    return Path(path).read_bytes()
+
+
+def _validate_json(data: bytes) -> Config:
+    """Parse and validate a JSON configuration document in one pass.
+
+    Args:
+        data: Raw JSON document.
+
+    Returns:
+        Validated Config object.
+
+    Raises:
+        ValueError: If the document is not valid JSON or configuration.
+    """
+    try:
+        return Config.model_validate_json(data)
+    except Exception as e:
+        raise ValueError(f"Invalid configuration: {e}")
+
+
+def _validate(config_dict: Dict[str, Any]) -> Config:
+    """Validate a configuration dictionary.
 
+    Args:
+        config_dict: Raw configuration dictionary.
+
+    Returns:
+        Validated Config object.
+
+    Raises:
+        ValueError: If configuration is invalid.
+    """
     try:
         return Config(**config_dict)
     except Exception as e:
@@ -1,9 +1,11 @@
 """Security hooks for bash command validation."""
 
-from typing import Optional
+import functools
+import re
+from typing import FrozenSet, Optional
 
 # Blocklist of dangerous bash commands
-DANGEROUS_COMMANDS = {
+DANGEROUS_COMMANDS: FrozenSet[str] = frozenset({
     "rm -rf",
     "rm -f /",
     "curl | sh",
@@ -17,10 +19,10 @@ DANGEROUS_COMMANDS = {
     "reboot",
     ":(){:|:;};:",  # fork bomb
     "truncate -s 0",
-}
+})
 
 # Allowlist of safe commands
-SAFE_COMMANDS = {
+SAFE_COMMANDS: FrozenSet[str] = frozenset({
     "git",
     "ls",
     "cd",
@@ -39,12 +41,23 @@ SAFE_COMMANDS = {
     "npm",
     "pip",
     "make",
-}
+})
 
+# All dangerous substrings compiled into one alternation so a command is
+# scanned once instead of once per blocklist entry. Longest first, so the
+# reported match is the most specific pattern at a given position.
+_DANGEROUS_PATTERN = re.compile(
+    "|".join(re.escape(d) for d in sorted(DANGEROUS_COMMANDS, key=len, reverse=True))
+)
 
+
+@functools.lru_cache(maxsize=1024)
 def validate_bash_command(command: str) -> Optional[str]:
     """Validate a bash command for security.
 
+    Results are memoized, since agents tend to repeat the same commands. The
+    block and allow lists are frozen, so cached results cannot go stale.
+
     Args:
         command: Command to validate.
 
@@ -52,16 +65,17 @@ def validate_bash_command(command: str) -> Optional[str]:
         Error message if command is unsafe, None if safe.
     """
     # Check for dangerous commands
-    for dangerous in DANGEROUS_COMMANDS:
-        if dangerous in command:
-            return f"Command blocked: contains dangerous operation '{dangerous}'"
+    match = _DANGEROUS_PATTERN.search(command)
+    if match:
+        return f"Command blocked: contains dangerous operation '{match.group()}'"
 
-    # Check that command starts with an allowed operation
-    cmd_parts = command.split()
+    # Check that command starts with an allowed operation. Only the first
+    # token is needed, so stop splitting after it.
+    cmd_parts = command.split(maxsplit=1)
     if not cmd_parts:
         return "Empty command"
 
-    base_cmd = cmd_parts[0].split("/")[-1]  # Handle paths like /usr/bin/git
+    base_cmd = cmd_parts[0].rpartition("/")[2]  # Handle paths like /usr/bin/git
 
     if base_cmd not in SAFE_COMMANDS:
         return f"Command '{base_cmd}' is not in allowlist"
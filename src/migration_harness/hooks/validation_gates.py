@@ -1,72 +1,160 @@
 """Validation hooks for tool outputs."""
 
-import json
-from typing import Any, Dict
+import functools
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+from migration_harness._json import loads
 from migration_harness.pipeline.gates import GateError
 
+# Digests of JSON outputs that already passed validation, keyed by phase.
+# Agents often resend identical output on retries, so a hit skips the parse.
+_VALIDATED: "OrderedDict[Tuple[str, bytes], None]" = OrderedDict()
+_VALIDATED_MAX = 512
 
-def validate_discovery_output(output: str) -> bool:
-    """Validate discovery phase tool output.
+# Result list field that each phase's output must carry
+_RESULT_FIELDS: Dict[str, str] = {
+    "discovery": "usages",
+    "narrowing": "narrowed_usages",
+    "generation": "generated_migrations",
+}
+
+
+def _output_digest(output: Any) -> Optional[bytes]:
+    """Hash a serialized tool output.
 
     Args:
-        output: Tool output to validate.
+        output: Tool output as str, bytes or an already-decoded object.
 
     Returns:
-        True if valid, False otherwise.
+        16-byte BLAKE2b digest, or None for decoded objects, which are
+        mutable and therefore not cached.
+    """
+    if isinstance(output, str):
+        # surrogatepass: a lone surrogate must reach the validator, which
+        # rejects it, rather than fail the hash
+        output = output.encode("utf-8", "surrogatepass")
+    elif not isinstance(output, bytes):
+        return None
+    return hashlib.blake2b(output, digest_size=16).digest()
+
+
+def _cache_valid_outputs(
+    phase: str,
+) -> Callable[[Callable[[Any], bool]], Callable[[Any], bool]]:
+    """Memoize successful validations of serialized output for a phase.
+
+    Only passing results are cached; failures are always re-checked. The
+    cache is bounded to ``_VALIDATED_MAX`` entries with LRU eviction.
+
+    Args:
+        phase: Phase name used in the cache key.
+
+    Returns:
+        Decorator for a validator function.
+    """
+
+    def decorator(validator: Callable[[Any], bool]) -> Callable[[Any], bool]:
+        @functools.wraps(validator)
+        def wrapper(output: Union[str, bytes, Dict[str, Any]]) -> bool:
+            digest = _output_digest(output)
+            if digest is None:
+                return validator(output)
+
+            key = (phase, digest)
+            if key in _VALIDATED:
+                _VALIDATED.move_to_end(key)
+                return True
+
+            valid = validator(output)
+            if valid:
+                _VALIDATED[key] = None
+                if len(_VALIDATED) > _VALIDATED_MAX:
+                    _VALIDATED.popitem(last=False)
+            return valid
+
+        return wrapper
+
+    return decorator
+
+
+def _as_dict(output: Any) -> Optional[Dict[str, Any]]:
+    """Return tool output as a decoded JSON object.
+
+    Dicts are returned as-is; only str/bytes output is parsed.
+
+    Args:
+        output: Tool output as a decoded dict or JSON str/bytes.
+
+    Returns:
+        The decoded object, or None if the output is not a JSON object.
     """
+    if isinstance(output, dict):
+        return output
+    if not isinstance(output, (str, bytes)):
+        return None
     try:
-        data = json.loads(output) if isinstance(output, str) else output
-        if not isinstance(data, dict):
-            return False
-        if data.get("phase") != "discovery":
-            return False
-        if not isinstance(data.get("usages", []), list):
-            return False
-        return True
-    except (json.JSONDecodeError, ValueError):
+        data = loads(output)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _validate_output(output: Any, phase: str) -> bool:
+    """Check that output is a JSON object for the phase with a list result.
+
+    Args:
+        output: Tool output as a decoded dict or JSON str/bytes.
+        phase: Expected phase name; its result field comes from
+            ``_RESULT_FIELDS``.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    data = _as_dict(output)
+    if data is None or data.get("phase") != phase:
         return False
+    return isinstance(data.get(_RESULT_FIELDS[phase], []), list)
+
 
+@_cache_valid_outputs("discovery")
+def validate_discovery_output(output: Union[str, bytes, Dict[str, Any]]) -> bool:
+    """Validate discovery phase tool output.
 
-def validate_narrowing_output(output: str) -> bool:
+    Args:
+        output: Tool output to validate. Pass the decoded dict when it is
+            already available; JSON is only parsed for str/bytes input.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    return _validate_output(output, "discovery")
+
+
+@_cache_valid_outputs("narrowing")
+def validate_narrowing_output(output: Union[str, bytes, Dict[str, Any]]) -> bool:
     """Validate narrowing phase tool output.
 
     Args:
-        output: Tool output to validate.
+        output: Tool output to validate. Pass the decoded dict when it is
+            already available; JSON is only parsed for str/bytes input.
 
     Returns:
         True if valid, False otherwise.
     """
-    try:
-        data = json.loads(output) if isinstance(output, str) else output
-        if not isinstance(data, dict):
-            return False
-        if data.get("phase") != "narrowing":
-            return False
-        if not isinstance(data.get("narrowed_usages", []), list):
-            return False
-        return True
-    except (json.JSONDecodeError, ValueError):
-        return False
+    return _validate_output(output, "narrowing")
 
 
-def validate_generation_output(output: str) -> bool:
+@_cache_valid_outputs("generation")
+def validate_generation_output(output: Union[str, bytes, Dict[str, Any]]) -> bool:
     """Validate generation phase tool output.
 
     Args:
-        output: Tool output to validate.
+        output: Tool output to validate. Pass the decoded dict when it is
+            already available; JSON is only parsed for str/bytes input.
 
     Returns:
         True if valid, False otherwise.
     """
-    try:
-        data = json.loads(output) if isinstance(output, str) else output
-        if not isinstance(data, dict):
-            return False
-        if data.get("phase") != "generation":
-            return False
-        if not isinstance(data.get("generated_migrations", []), list):
-            return False
-        return True
-    except (json.JSONDecodeError, ValueError):
-        return False
+    return _validate_output(output, "generation")
@@ -5,8 +5,6 @@ import asyncio
 import sys
 from pathlib import Path
 
-from migration_harness.orchestrator import Orchestrator
-
 
 def main():
     """Main CLI entry point."""
@@ -32,6 +30,10 @@ def main():
         print(f"Error: Config file not found: {args.config}", file=sys.stderr)
         return 1
 
+    # Deferred so --help and argument errors don't pay for importing the
+    # pipeline (pydantic schema, tools, agents)
+    from migration_harness.orchestrator import Orchestrator
+
     try:
         orchestrator = Orchestrator.from_config_file(str(config_path))
 
@@ -2,7 +2,7 @@
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from migration_harness.agents.definitions import AgentDefinitions
 from migration_harness.config import load_config
@@ -16,13 +16,30 @@ from migration_harness.pipeline.runner import PhaseRunner
 from migration_harness.schema import Config
 from migration_harness.state.manager import StateManager
 from migration_harness.state.progress import ProgressTracker
+from migration_harness.tools.registry import ToolRegistry
 
 
 class Orchestrator:
     """Orchestrates the REST-to-GraphQL migration pipeline."""
 
+    __slots__ = (
+        "config",
+        "state_manager",
+        "progress_tracker",
+        "agent_definitions",
+        "tool_registry",
+        "_runners",
+    )
+
     PHASES = ["discovery", "narrowing", "generation", "migration", "validation"]
 
+    # Blocking gates per phase. Migration and validation have none.
+    _GATES: Dict[str, Callable[[Dict[str, Any]], None]] = {
+        "discovery": validate_discovery_gate,
+        "narrowing": validate_narrowing_gate,
+        "generation": validate_generation_gate,
+    }
+
     def __init__(self, config: Config):
         """Initialize orchestrator.
 
@@ -33,6 +50,17 @@ class Orchestrator:
         self.state_manager = StateManager(config.work_dir)
         self.progress_tracker = ProgressTracker(config.work_dir)
         self.agent_definitions = AgentDefinitions(config)
+        self.tool_registry = ToolRegistry(config, self.state_manager)
+        self._runners = {
+            phase: PhaseRunner(
+                config,
+                self.state_manager,
+                self.progress_tracker,
+                phase,
+                tool_registry=self.tool_registry,
+            )
+            for phase in self.PHASES
+        }
 
     @classmethod
     def from_config_file(cls, config_path: str) -> "Orchestrator":
@@ -58,12 +86,7 @@ class Orchestrator:
         try:
             for phase in self.PHASES:
                 print(f"Starting phase: {phase}")
-                runner = PhaseRunner(
-                    self.config,
-                    self.state_manager,
-                    self.progress_tracker,
-                    phase,
-                )
+                runner = self._runners[phase]
 
                 result = await runner.run()
 
@@ -88,19 +111,18 @@ class Orchestrator:
 
         Args:
             phase: Phase name.
-            result: Phase result to validate.
+            result: Decoded phase result from ``PhaseRunner.run()``. Gates
+                check the dict directly; it is never re-serialized.
 
         Returns:
             True if validation passed, False otherwise.
         """
+        gate = self._GATES.get(phase)
+        if gate is None:
+            return True
+
         try:
-            if phase == "discovery":
-                validate_discovery_gate(result)
-            elif phase == "narrowing":
-                validate_narrowing_gate(result)
-            elif phase == "generation":
-                validate_generation_gate(result)
-            # Migration and validation gates are non-blocking
+            gate(result)
             return True
         except GateError as e:
             print(f"Gate validation failed for {phase}: {e}")
@@ -69,7 +69,10 @@ def validate_generation_gate(result: Dict[str, Any]) -> None:
         raise GateError("Generation must produce at least one migration")
 
     for migration in migrations:
-        if not migration.get("graphql_query", "").strip():
+        # isspace() tests for blank text without allocating a stripped copy
+        query = migration.get("graphql_query")
+        if not query or query.isspace():
             raise GateError("All migrations must have non-empty graphql_query")
-        if not migration.get("new_code", "").strip():
+        new_code = migration.get("new_code")
+        if not new_code or new_code.isspace():
             raise GateError("All migrations must have non-empty new_code")
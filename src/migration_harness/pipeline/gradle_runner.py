@@ -15,20 +15,38 @@ Because Gradle's daemon keeps the JVM warm between invocations, repeated calls
 during iteration are fast even across Python/Java language boundaries.
 """
 
+import collections
+import itertools
 import subprocess
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Deque, List, Tuple, Type
 
 from migration_harness.schema import ValidationCheck
 
+try:
+    from lxml import etree as lxml_etree  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - depends on the environment
+    lxml_etree = None
+
+# Malformed-report errors from whichever parser is in use
+_XML_ERRORS: Tuple[Type[BaseException], ...] = (ET.ParseError,)
+if lxml_etree is not None:
+    _XML_ERRORS += (lxml_etree.XMLSyntaxError,)
+
 
 class GradleRunner:
     """Runs `gradle test` and parses JUnit XML reports into ValidationChecks."""
 
+    __slots__ = ("repo_path",)
+
     # Relative to the repo root passed to the constructor
     TEST_RESULTS_DIR = Path("build/test-results/test")
 
+    # Lines of Gradle output kept for the failure details
+    OUTPUT_TAIL_LINES = 200
+
     def __init__(self, repo_path: str):
         """
         Args:
@@ -77,22 +95,30 @@ class GradleRunner:
         """
         Execute `gradle test --daemon` in the project directory.
 
+        Output is streamed line by line and only the last
+        ``OUTPUT_TAIL_LINES`` lines are kept, so long test runs don't buffer
+        their whole log in memory.
+
         Returns:
-            (success, combined_stdout_stderr)
+            (success, tail of combined stdout/stderr)
         """
         cmd = ["gradle", "test", "--daemon", "--continue"] + extra_args
-        result = subprocess.run(
+        tail: Deque[str] = collections.deque(maxlen=self.OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
             cmd,
             cwd=str(self.repo_path),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-        )
-        output = result.stdout + result.stderr
-        return result.returncode == 0, output
+        ) as proc:
+            assert proc.stdout is not None  # stdout=PIPE
+            tail.extend(proc.stdout)
+            returncode = proc.wait()
+        return returncode == 0, "".join(tail)
 
     def _parse_junit_xml(self) -> List[ValidationCheck]:
         """
-        Parse every *.xml file in the JUnit report directory.
+        Parse every TEST-*.xml file in the JUnit report directory.
 
         JUnit XML structure:
             <testsuite name="..." tests="N" failures="F" errors="E">
@@ -101,56 +127,87 @@ class GradleRunner:
               </testcase>
             </testsuite>
 
+        Files are independent, so multi-file reports are parsed on a thread
+        pool; results keep the sorted file order.
+
         Returns:
             One ValidationCheck per <testcase> element.
         """
-        checks: List[ValidationCheck] = []
         report_dir = self.repo_path / self.TEST_RESULTS_DIR
 
         if not report_dir.exists():
-            return checks
+            return []
 
-        for xml_file in sorted(report_dir.glob("*.xml")):
-            checks.extend(self._parse_single_xml(xml_file))
+        xml_files = sorted(report_dir.glob("TEST-*.xml"))
+        if len(xml_files) <= 1:
+            return [check for f in xml_files for check in self._parse_single_xml(f)]
 
-        return checks
+        with ThreadPoolExecutor() as pool:
+            per_file = pool.map(self._parse_single_xml, xml_files)
+            return list(itertools.chain.from_iterable(per_file))
 
     def _parse_single_xml(self, xml_file: Path) -> List[ValidationCheck]:
+        """
+        Stream one JUnit XML file, building a check as each <testcase> closes.
+
+        Processed testcases are cleared immediately, so memory stays flat
+        even for report files with thousands of cases.  A malformed file
+        yields no checks at all, as before.
+
+        Uses lxml's libxml2 parser when it is installed
+        (``pip install migration-harness[fast]``), which also filters on the
+        tag in C; otherwise falls back to ``xml.etree``.
+        """
         checks: List[ValidationCheck] = []
+        if lxml_etree is not None:
+            events = lxml_etree.iterparse(str(xml_file), events=("end",), tag="testcase")
+        else:
+            events = ET.iterparse(str(xml_file), events=("end",))
         try:
-            tree = ET.parse(xml_file)
-        except ET.ParseError:
-            return checks
-
-        for testcase in tree.iter("testcase"):
-            class_name = testcase.get("classname", "")
-            test_name  = testcase.get("name", "")
-            check_name = f"{class_name}.{test_name}"
-
-            # <failure> or <error> child → test did not pass
-            failure = testcase.find("failure")
-            error   = testcase.find("error")
-            skipped = testcase.find("skipped")
-
-            if skipped is not None:
-                checks.append(ValidationCheck(
-                    check_name=check_name,
-                    passed=True,         # skipped ≠ failed
-                    details="SKIPPED",
-                ))
-            elif failure is not None or error is not None:
-                node    = failure if failure is not None else error
-                message = node.get("message", node.text or "")
-                checks.append(ValidationCheck(
-                    check_name=check_name,
-                    passed=False,
-                    details=message[:500],   # cap length for readability
-                ))
-            else:
-                checks.append(ValidationCheck(
-                    check_name=check_name,
-                    passed=True,
-                    details="PASSED",
-                ))
+            for _, testcase in events:
+                if testcase.tag != "testcase":
+                    continue
+                checks.append(self._testcase_to_check(testcase))
+                testcase.clear()
+        except _XML_ERRORS:
+            return []
 
         return checks
+
+    @staticmethod
+    def _testcase_to_check(testcase: ET.Element) -> ValidationCheck:
+        class_name = testcase.get("classname", "")
+        test_name  = testcase.get("name", "")
+        check_name = f"{class_name}.{test_name}"
+
+        # <failure> or <error> child → test did not pass.  One pass over the
+        # children instead of three find() calls; the first of each tag wins.
+        failure = error = skipped = None
+        for child in testcase:
+            tag = child.tag
+            if tag == "failure":
+                failure = child if failure is None else failure
+            elif tag == "error":
+                error = child if error is None else error
+            elif tag == "skipped":
+                skipped = child
+
+        if skipped is not None:
+            return ValidationCheck(
+                check_name=check_name,
+                passed=True,         # skipped ≠ failed
+                details="SKIPPED",
+            )
+        if failure is not None or error is not None:
+            node    = failure if failure is not None else error
+            message = node.get("message", node.text or "")
+            return ValidationCheck(
+                check_name=check_name,
+                passed=False,
+                details=message[:500],   # cap length for readability
+            )
+        return ValidationCheck(
+            check_name=check_name,
+            passed=True,
+            details="PASSED",
+        )
@@ -8,6 +8,11 @@ from typing import Optional
 class RollbackManager:
     """Manages git savepoints and rollback."""
 
+    __slots__ = (
+        "repo_path",
+        "_git_prefix",
+    )
+
     def __init__(self, repo_path: str):
         """Initialize rollback manager.
 
@@ -15,6 +20,26 @@ class RollbackManager:
             repo_path: Path to git repository.
         """
         self.repo_path = Path(repo_path)
+        self._git_prefix = ("git", "-C", str(self.repo_path))
+
+    def _git(self, *args: str) -> "subprocess.CompletedProcess[str]":
+        """Run a git command against the repository.
+
+        Args:
+            *args: Git subcommand and its arguments.
+
+        Returns:
+            Completed process with captured text output.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits non-zero.
+        """
+        return subprocess.run(
+            [*self._git_prefix, *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
 
     def create_savepoint(self, phase: str) -> str:
         """Create a git savepoint before a phase.
@@ -29,14 +54,10 @@ class RollbackManager:
 
         try:
             # Create and checkout savepoint branch
-            subprocess.run(
-                ["git", "-C", str(self.repo_path), "checkout", "-b", branch_name],
-                check=True,
-                capture_output=True,
-            )
+            self._git("checkout", "-b", branch_name)
             return branch_name
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to create savepoint: {e.stderr.decode()}")
+            raise RuntimeError(f"Failed to create savepoint: {e.stderr}")
 
     def rollback_to_savepoint(self, branch_name: str) -> None:
         """Rollback repository to a savepoint.
@@ -48,22 +69,9 @@ class RollbackManager:
             RuntimeError: If rollback fails.
         """
         try:
-            # Get the original branch
-            result = subprocess.run(
-                ["git", "-C", str(self.repo_path), "branch", "-a"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            # Switch to savepoint branch and reset
-            subprocess.run(
-                ["git", "-C", str(self.repo_path), "checkout", branch_name],
-                check=True,
-                capture_output=True,
-            )
+            self._git("checkout", branch_name)
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to rollback to savepoint: {e.stderr.decode()}")
+            raise RuntimeError(f"Failed to rollback to savepoint: {e.stderr}")
 
     def delete_savepoint(self, branch_name: str) -> None:
         """Delete a savepoint branch.
@@ -72,11 +80,7 @@ class RollbackManager:
             branch_name: Savepoint branch name to delete.
         """
         try:
-            subprocess.run(
-                ["git", "-C", str(self.repo_path), "branch", "-D", branch_name],
-                check=True,
-                capture_output=True,
-            )
+            self._git("branch", "-D", branch_name)
         except subprocess.CalledProcessError:
             # Ignore errors if branch doesn't exist
             pass
@@ -88,12 +92,6 @@ class RollbackManager:
             Commit hash or None if not in a git repo.
         """
         try:
-            result = subprocess.run(
-                ["git", "-C", str(self.repo_path), "rev-parse", "HEAD"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return result.stdout.strip()
+            return self._git("rev-parse", "HEAD").stdout.strip()
         except subprocess.CalledProcessError:
             return None
@@ -1,8 +1,9 @@
 """Phase runner for managing individual phase executions."""
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
-from migration_harness.schema import Config
+from migration_harness.schema import Config, Repository
 from migration_harness.state.manager import StateManager
 from migration_harness.state.progress import ProgressTracker
 from migration_harness.tools.registry import ToolRegistry
@@ -11,12 +12,25 @@ from migration_harness.tools.registry import ToolRegistry
 class PhaseRunner:
     """Runs a single migration phase."""
 
+    __slots__ = (
+        "config",
+        "state_manager",
+        "progress_tracker",
+        "phase",
+        "tool_registry",
+    )
+
+    # Phases whose work is independent per repository, mapped to the result
+    # list that is concatenated when merging per-repo results.
+    PER_REPO_PHASES = {"discovery": "usages", "narrowing": "narrowed_usages"}
+
     def __init__(
         self,
         config: Config,
         state_manager: StateManager,
         progress_tracker: ProgressTracker,
         phase: str,
+        tool_registry: Optional[ToolRegistry] = None,
     ):
         """Initialize phase runner.
 
@@ -25,12 +39,14 @@ class PhaseRunner:
             state_manager: State manager instance.
             progress_tracker: Progress tracker instance.
             phase: Phase name (discovery, narrowing, etc.).
+            tool_registry: Registry to share with other runners. A new one is
+                created if not given.
         """
         self.config = config
         self.state_manager = state_manager
         self.progress_tracker = progress_tracker
         self.phase = phase
-        self.tool_registry = ToolRegistry(config, state_manager)
+        self.tool_registry = tool_registry or ToolRegistry(config, state_manager)
 
     async def run(self) -> Optional[Dict[str, Any]]:
         """Run the phase.
@@ -65,6 +81,9 @@ class PhaseRunner:
         Returns:
             Phase result or None if failed.
         """
+        if self.phase in self.PER_REPO_PHASES:
+            return await self._execute_per_repo()
+
         # Placeholder for actual phase execution
         # In real implementation, this would:
         # 1. Create a ClaudeSDKClient
@@ -72,3 +91,67 @@ class PhaseRunner:
         # 3. Run the agent with phase-specific prompt
         # 4. Return the result
         return None
+
+    async def _execute_per_repo(self) -> Optional[Dict[str, Any]]:
+        """Run the phase for every repository concurrently and merge results.
+
+        At most ``options.max_concurrent_repos`` repositories run at a time.
+        If one repository raises, the others are cancelled before the error
+        propagates.
+
+        Returns:
+            Merged phase result or None if no repository produced one.
+        """
+        semaphore = asyncio.Semaphore(self.config.options.max_concurrent_repos)
+
+        async def run_one(repo: Repository) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._execute_for_repo(repo)
+
+        tasks = [asyncio.ensure_future(run_one(repo)) for repo in self.config.repositories]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return self._merge_repo_results(results)
+
+    async def _execute_for_repo(self, repo: Repository) -> Optional[Dict[str, Any]]:
+        """Execute the phase logic for a single repository.
+
+        Args:
+            repo: Repository to process.
+
+        Returns:
+            Partial phase result for this repository or None if failed.
+        """
+        # Placeholder for a repository-scoped ClaudeSDKClient session
+        return None
+
+    def _merge_repo_results(
+        self, results: List[Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Merge per-repository results into one phase result.
+
+        The phase's list field is concatenated across repositories. Every
+        other field, such as ``phase`` and ``timestamp``, is taken from the
+        first successful repository's result.
+
+        Args:
+            results: Per-repository results, in repository order.
+
+        Returns:
+            Merged result or None if every repository failed.
+        """
+        succeeded = [result for result in results if result is not None]
+        if not succeeded:
+            return None
+
+        list_field = self.PER_REPO_PHASES[self.phase]
+        merged = dict(succeeded[0])
+        merged[list_field] = [
+            item for result in succeeded for item in result.get(list_field, [])
+        ]
+        return merged
@@ -1,28 +1,66 @@
 """Pydantic models for migration harness data structures."""
 
-from typing import List, Literal
+import functools
+import re
+from typing import Dict, List, Literal, Optional, Pattern, Tuple, Type, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class RestEndpoint(BaseModel):
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Compile literal code patterns into a single alternation.
+
+    Args:
+        patterns: Literal patterns to match.
+
+    Returns:
+        Compiled regex matching any of the patterns, longest first so the
+        most specific pattern wins at a given position.
+    """
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile("|".join(re.escape(p) for p in ordered))
+
+
+class FrozenModel(BaseModel):
+    """Base for all harness models.
+
+    Attribute assignment is rejected; derive changed copies with
+    ``model_copy(update=...)``. List fields are still mutable, so a cached
+    instance must be deep-copied before it is shared.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class RestEndpoint(FrozenModel):
     """REST endpoint configuration."""
 
     id: str = Field(..., description="Unique endpoint identifier")
     method: str = Field(..., description="HTTP method (GET, POST, etc.)")
     path: str = Field(..., description="API path (e.g., /api/v1/users/{id})")
-    patterns: List[str] = Field(..., description="Code patterns to search for")
+    patterns: List[str] = Field(
+        ..., min_length=1, description="Code patterns to search for (at least one)"
+    )
+
+    def match_any(self, text: str) -> Optional[str]:
+        """Find the first occurrence of any of the endpoint's patterns.
 
-    @field_validator("patterns")
-    @classmethod
-    def patterns_not_empty(cls, v: List[str]) -> List[str]:
-        """Ensure patterns list is not empty."""
-        if not v:
-            raise ValueError("patterns cannot be empty")
-        return v
+        Patterns are literal code snippets. They are compiled once (cached
+        per pattern list) into a single alternation, so a file is scanned in
+        one pass instead of once per pattern.
 
+        Args:
+            text: Source text to scan.
 
-class AttributeMapping(BaseModel):
+        Returns:
+            The matched pattern text, or None if no pattern occurs.
+        """
+        match = _compile_patterns(tuple(self.patterns)).search(text)
+        return match.group() if match else None
+
+
+class AttributeMapping(FrozenModel):
     """Mapping from REST attribute to GraphQL field."""
 
     endpoint_id: str = Field(..., description="Associated endpoint ID")
@@ -31,7 +69,7 @@ class AttributeMapping(BaseModel):
     graphql_type: str = Field(..., description="GraphQL type containing this field")
 
 
-class Repository(BaseModel):
+class Repository(FrozenModel):
     """Git repository configuration."""
 
     name: str = Field(..., description="Repository name")
@@ -42,7 +80,7 @@ class Repository(BaseModel):
     )
 
 
-class ConfigOptions(BaseModel):
+class ConfigOptions(FrozenModel):
     """Configuration options for the migration."""
 
     dry_run: bool = Field(default=True, description="Run without applying changes")
@@ -53,7 +91,7 @@ class ConfigOptions(BaseModel):
         default="migration/rest-to-graphql", description="Prefix for feature branches"
     )
     max_concurrent_repos: int = Field(
-        default=2, description="Maximum concurrent repository processing"
+        default=2, ge=1, description="Maximum concurrent repository processing"
     )
     model: str = Field(
         default="claude-sonnet-4-5-20250929", description="Claude model to use"
@@ -63,13 +101,13 @@ class ConfigOptions(BaseModel):
     )
 
 
-class Config(BaseModel):
+class Config(FrozenModel):
     """Main migration configuration."""
 
     project_name: str = Field(..., description="Project name")
     work_dir: str = Field(..., description="Working directory for migrations")
     repositories: List[Repository] = Field(
-        ..., description="List of repositories to migrate"
+        ..., min_length=1, description="List of repositories to migrate (at least one)"
     )
     rest_endpoints: List[RestEndpoint] = Field(..., description="REST endpoints")
     attribute_mappings: List[AttributeMapping] = Field(
@@ -79,16 +117,8 @@ class Config(BaseModel):
     graphql_schema_path: str = Field(..., description="Path to GraphQL schema file")
     options: ConfigOptions = Field(default_factory=ConfigOptions)
 
-    @field_validator("repositories")
-    @classmethod
-    def repositories_not_empty(cls, v: List[Repository]) -> List[Repository]:
-        """Ensure repositories list is not empty."""
-        if not v:
-            raise ValueError("repositories cannot be empty")
-        return v
-
 
-class EndpointUsage(BaseModel):
+class EndpointUsage(FrozenModel):
     """Discovery of a REST endpoint usage in code."""
 
     endpoint_id: str = Field(..., description="Endpoint ID")
@@ -99,7 +129,7 @@ class EndpointUsage(BaseModel):
     language: str = Field(..., description="Programming language")
 
 
-class DiscoveryResult(BaseModel):
+class DiscoveryResult(FrozenModel):
     """Output of discovery phase."""
 
     phase: Literal["discovery"] = "discovery"
@@ -107,7 +137,7 @@ class DiscoveryResult(BaseModel):
     usages: List[EndpointUsage] = Field(..., description="All discovered usages")
 
 
-class NarrowedUsage(BaseModel):
+class NarrowedUsage(FrozenModel):
     """Endpoint usage that passes narrowing filters."""
 
     endpoint_id: str = Field(..., description="Endpoint ID")
@@ -124,7 +154,7 @@ class NarrowedUsage(BaseModel):
     )
 
 
-class NarrowingResult(BaseModel):
+class NarrowingResult(FrozenModel):
     """Output of narrowing phase."""
 
     phase: Literal["narrowing"] = "narrowing"
@@ -134,7 +164,7 @@ class NarrowingResult(BaseModel):
     )
 
 
-class GeneratedMigration(BaseModel):
+class GeneratedMigration(FrozenModel):
     """Generated migration code for one usage."""
 
     endpoint_id: str = Field(..., description="Endpoint ID")
@@ -145,7 +175,7 @@ class GeneratedMigration(BaseModel):
     imports: List[str] = Field(..., description="Required imports")
 
 
-class GenerationResult(BaseModel):
+class GenerationResult(FrozenModel):
     """Output of generation phase."""
 
     phase: Literal["generation"] = "generation"
@@ -155,7 +185,7 @@ class GenerationResult(BaseModel):
     )
 
 
-class AppliedMigration(BaseModel):
+class AppliedMigration(FrozenModel):
     """Metadata about an applied migration."""
 
     endpoint_id: str = Field(..., description="Endpoint ID")
@@ -167,7 +197,7 @@ class AppliedMigration(BaseModel):
     commit: str = Field(..., description="Commit hash")
 
 
-class MigrationResult(BaseModel):
+class MigrationResult(FrozenModel):
     """Output of migration phase."""
 
     phase: Literal["migration"] = "migration"
@@ -177,7 +207,7 @@ class MigrationResult(BaseModel):
     )
 
 
-class ValidationCheck(BaseModel):
+class ValidationCheck(FrozenModel):
     """Single validation check result."""
 
     check_name: str = Field(..., description="Check name")
@@ -185,9 +215,36 @@ class ValidationCheck(BaseModel):
     details: str = Field(..., description="Check details/error message")
 
 
-class ValidationResult(BaseModel):
+class ValidationResult(FrozenModel):
     """Output of validation phase."""
 
     phase: Literal["validation"] = "validation"
     timestamp: str = Field(..., description="ISO timestamp")
     checks: List[ValidationCheck] = Field(..., description="Validation checks")
+
+
+# Result model for each pipeline phase, keyed by phase name
+PHASE_MODELS: Dict[str, Type[BaseModel]] = {
+    "discovery": DiscoveryResult,
+    "narrowing": NarrowingResult,
+    "generation": GenerationResult,
+    "migration": MigrationResult,
+    "validation": ValidationResult,
+}
+
+
+def validate_phase_result(phase: str, raw: Union[str, bytes]) -> BaseModel:
+    """Validate a serialized phase result against its phase model.
+
+    Args:
+        phase: Phase name (e.g., 'discovery').
+        raw: Phase result as JSON text or bytes.
+
+    Returns:
+        Validated result model instance.
+
+    Raises:
+        KeyError: If the phase is unknown.
+        pydantic.ValidationError: If the result is invalid.
+    """
+    return PHASE_MODELS[phase].model_validate_json(raw)
@@ -0,0 +1,76 @@
+"""File helpers for state persistence."""
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Set, Tuple
+
+# Directories already created by ensure_dir() in this process
+_ensured_dirs: Set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory and its parents once per process.
+
+    State components sharing a work dir are constructed repeatedly; after
+    the first call the ``mkdir`` walk is skipped.
+
+    Args:
+        path: Directory to create.
+    """
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def file_key(stat: os.stat_result) -> Tuple[int, int, int, int]:
+    """Build the cache key identifying one version of a state file.
+
+    Every write replaces the file, so the inode changes even when a rewrite
+    has the same size and lands in the same mtime tick; ``st_ctime_ns``
+    also catches in-place edits and cannot be reset with ``os.utime``.
+
+    Args:
+        stat: Result of ``os.stat`` on the file.
+
+    Returns:
+        ``(st_ino, st_mtime_ns, st_ctime_ns, st_size)``.
+    """
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents atomically.
+
+    The data is written to a uniquely named temporary file next to ``path``
+    with as few ``write`` calls as possible and then moved over ``path``, so
+    readers never see a partially written file and concurrent writers never
+    share a temporary file.
+
+    Args:
+        path: Destination file.
+        data: Complete file contents.
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    except FileNotFoundError:
+        # The directory was removed after ensure_dir() recorded it
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        try:
+            # mkstemp creates the file owner-only; keep the usual permissions
+            os.chmod(tmp_name, 0o644)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
@@ -1,21 +1,36 @@
 """State management for migration phases."""
 
-import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from migration_harness._json import dumps, loads
+from migration_harness.state._files import ensure_dir, file_key, write_bytes_atomic
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 
 class StateManager:
     """Manages inter-phase state persistence."""
 
-    def __init__(self, work_dir: str):
+    def __init__(self, work_dir: str, pretty: bool = False):
         """Initialize state manager.
 
         Args:
             work_dir: Working directory for storing state files.
+            pretty: Write indented JSON instead of compact JSON. Compact
+                files are much smaller for large results; use
+                ``python -m json.tool`` to inspect them.
         """
         self.work_dir = Path(work_dir)
-        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.pretty = pretty
+        # Serialized result per phase, keyed by the state file's file_key()
+        # when it was written or read, so repeated gets of an unchanged file
+        # skip the read. Results are still decoded on
+        # every get, so callers never share a mutable dict with the cache.
+        self._cache: Dict[str, Tuple[Tuple[int, int, int, int], bytes]] = {}
+        ensure_dir(self.work_dir)
 
     def _get_state_file(self, phase: str) -> Path:
         """Get the state file path for a phase.
@@ -28,13 +43,39 @@ class StateManager:
         """
         return self.work_dir / f"{phase}-result.json"
 
+    def _read_state(self, phase: str) -> Optional[bytes]:
+        """Get the serialized result for a phase.
+
+        Args:
+            phase: Phase name.
+
+        Returns:
+            State file contents, served from the cache while the file is
+            unchanged, or None if the file doesn't exist.
+        """
+        file_path = self._get_state_file(phase)
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._cache.pop(phase, None)
+            return None
+
+        key = file_key(stat)
+        cached = self._cache.get(phase)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        data = file_path.read_bytes()
+        self._cache[phase] = (key, data)
+        return data
+
     def save_discovery_result(self, result: Dict[str, Any]) -> None:
         """Save discovery phase result.
 
         Args:
             result: Discovery result dictionary.
         """
-        self._save_result("discovery", result)
+        self.save_result("discovery", result)
 
     def get_discovery_result(self) -> Optional[Dict[str, Any]]:
         """Get discovery phase result.
@@ -42,7 +83,7 @@ class StateManager:
         Returns:
             Discovery result or None if not found.
         """
-        return self._get_result("discovery")
+        return self.get_result("discovery")
 
     def save_narrowing_result(self, result: Dict[str, Any]) -> None:
         """Save narrowing phase result.
@@ -50,7 +91,7 @@ class StateManager:
         Args:
             result: Narrowing result dictionary.
         """
-        self._save_result("narrowing", result)
+        self.save_result("narrowing", result)
 
     def get_narrowing_result(self) -> Optional[Dict[str, Any]]:
         """Get narrowing phase result.
@@ -58,7 +99,7 @@ class StateManager:
         Returns:
             Narrowing result or None if not found.
         """
-        return self._get_result("narrowing")
+        return self.get_result("narrowing")
 
     def save_generation_result(self, result: Dict[str, Any]) -> None:
         """Save generation phase result.
@@ -66,7 +107,7 @@ class StateManager:
         Args:
             result: Generation result dictionary.
         """
-        self._save_result("generation", result)
+        self.save_result("generation", result)
 
     def get_generation_result(self) -> Optional[Dict[str, Any]]:
         """Get generation phase result.
@@ -74,7 +115,7 @@ class StateManager:
         Returns:
             Generation result or None if not found.
         """
-        return self._get_result("generation")
+        return self.get_result("generation")
 
     def save_migration_result(self, result: Dict[str, Any]) -> None:
         """Save migration phase result.
@@ -82,7 +123,7 @@ class StateManager:
         Args:
             result: Migration result dictionary.
         """
-        self._save_result("migration", result)
+        self.save_result("migration", result)
 
     def get_migration_result(self) -> Optional[Dict[str, Any]]:
         """Get migration phase result.
@@ -90,7 +131,7 @@ class StateManager:
         Returns:
             Migration result or None if not found.
         """
-        return self._get_result("migration")
+        return self.get_result("migration")
 
     def save_validation_result(self, result: Dict[str, Any]) -> None:
         """Save validation phase result.
@@ -98,7 +139,7 @@ class StateManager:
         Args:
             result: Validation result dictionary.
         """
-        self._save_result("validation", result)
+        self.save_result("validation", result)
 
     def get_validation_result(self) -> Optional[Dict[str, Any]]:
         """Get validation phase result.
@@ -106,21 +147,62 @@ class StateManager:
         Returns:
             Validation result or None if not found.
         """
-        return self._get_result("validation")
+        return self.get_result("validation")
+
+    def get_result_model(self, phase: str) -> Optional["BaseModel"]:
+        """Get a phase result parsed into its schema model.
+
+        The file bytes are validated by pydantic-core in a single pass,
+        without building an intermediate dict.
+
+        Args:
+            phase: Phase name (e.g., 'discovery').
+
+        Returns:
+            Result model from ``PHASE_MODELS`` or None if file doesn't exist.
+
+        Raises:
+            KeyError: If the phase is unknown.
+            pydantic.ValidationError: If the stored result doesn't match the
+                phase model.
+        """
+        # Imported here so plain state access doesn't load pydantic models
+        from migration_harness.schema import PHASE_MODELS, validate_phase_result
 
-    def _save_result(self, phase: str, result: Dict[str, Any]) -> None:
-        """Save result to file.
+        if phase not in PHASE_MODELS:
+            raise KeyError(phase)
+
+        data = self._read_state(phase)
+        if data is None:
+            return None
+
+        return validate_phase_result(phase, data)
+
+    def save_result(
+        self, phase: str, result: Dict[str, Any], pretty: Optional[bool] = None
+    ) -> None:
+        """Save a phase result to its state file.
+
+        The ``save_<phase>_result`` methods are shorthands for this.
 
         Args:
             phase: Phase name.
             result: Result dictionary.
+            pretty: Write indented JSON for this result; defaults to the
+                instance's ``pretty`` setting.
         """
+        if pretty is None:
+            pretty = self.pretty
         file_path = self._get_state_file(phase)
-        with open(file_path, "w") as f:
-            json.dump(result, f, indent=2)
+        data = dumps(result, indent=pretty)
+        write_bytes_atomic(file_path, data)
+        stat = os.stat(file_path)
+        self._cache[phase] = (file_key(stat), data)
+
+    def get_result(self, phase: str) -> Optional[Dict[str, Any]]:
+        """Get a phase result from its state file.
 
-    def _get_result(self, phase: str) -> Optional[Dict[str, Any]]:
-        """Get result from file.
+        The ``get_<phase>_result`` methods are shorthands for this.
 
         Args:
             phase: Phase name.
@@ -128,9 +210,9 @@ class StateManager:
         Returns:
             Result dictionary or None if file doesn't exist.
         """
-        file_path = self._get_state_file(phase)
-        if not file_path.exists():
+        data = self._read_state(phase)
+        if data is None:
             return None
 
-        with open(file_path) as f:
-            return json.load(f)
+        result: Dict[str, Any] = loads(data)
+        return result
@@ -1,15 +1,42 @@
 """Progress tracking for migration pipeline."""
 
-import json
-from datetime import datetime
+import contextlib
+import copy
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from migration_harness._json import dumps, loads
+from migration_harness.state._files import ensure_dir, file_key, write_bytes_atomic
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with a 'Z' suffix.
+
+    Formats from ``time.time()`` directly rather than building a datetime.
+
+    Returns:
+        Timestamp such as ``2025-01-01T00:00:00.000000Z``.
+    """
+    now = time.time()
+    seconds = int(now)
+    micros = int((now - seconds) * 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{micros:06d}Z"
 
 
 class ProgressTracker:
-    """Tracks progress through migration phases."""
+    """Tracks progress through migration phases.
+
+    Progress is kept in memory, re-read when the file is changed by another
+    writer, and written to disk after every update. Wrap several updates in
+    ``batch()`` to write the file once at the end.
+    Session logs are appended to per-phase JSONL files under ``sessions/``
+    and merged into the phase entries by ``read_progress()``.
+    """
 
     PROGRESS_FILE = "migration-progress.txt"
+    SESSIONS_DIR = "sessions"
 
     def __init__(self, work_dir: str):
         """Initialize progress tracker.
@@ -18,21 +45,34 @@ class ProgressTracker:
             work_dir: Working directory for storing progress file.
         """
         self.work_dir = Path(work_dir)
-        self.work_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.work_dir)
         self.progress_file = self.work_dir / self.PROGRESS_FILE
+        self.sessions_dir = self.work_dir / self.SESSIONS_DIR
+        self._progress: Optional[Dict[str, Any]] = None
+        # file_key() of the progress file when _progress was last read or
+        # written
+        self._file_key: Optional[Tuple[int, int, int, int]] = None
+        self._batch_depth = 0
+        self._dirty = False
 
     def init_progress(self, project_name: str) -> None:
         """Initialize progress tracking for a project.
 
+        Discards the phases and session logs of any previous run.
+
         Args:
             project_name: Name of the project being migrated.
         """
+        for log_path in self.sessions_dir.glob("*.jsonl"):
+            log_path.unlink()
+
         progress = {
             "project": project_name,
-            "started_at": datetime.utcnow().isoformat() + "Z",
+            "started_at": _now_iso(),
             "phases": {},
         }
-        self._write_progress(progress)
+        self._progress = progress
+        self._flush()
 
     def mark_phase_started(self, phase: str) -> None:
         """Mark a phase as started.
@@ -40,18 +80,10 @@ class ProgressTracker:
         Args:
             phase: Phase name.
         """
-        progress = self.read_progress() or {"phases": {}}
-
-        if phase not in progress["phases"]:
-            progress["phases"][phase] = {}
-
-        progress["phases"][phase].update(
-            {
-                "status": "in_progress",
-                "started_at": datetime.utcnow().isoformat() + "Z",
-            }
-        )
-        self._write_progress(progress)
+        entry = self._phase_entry(phase)
+        entry["status"] = "in_progress"
+        entry["started_at"] = _now_iso()
+        self._flush()
 
     def mark_phase_completed(self, phase: str, summary: str = "") -> None:
         """Mark a phase as completed.
@@ -60,19 +92,11 @@ class ProgressTracker:
             phase: Phase name.
             summary: Summary of phase results.
         """
-        progress = self.read_progress() or {"phases": {}}
-
-        if phase not in progress["phases"]:
-            progress["phases"][phase] = {}
-
-        progress["phases"][phase].update(
-            {
-                "status": "completed",
-                "completed_at": datetime.utcnow().isoformat() + "Z",
-                "summary": summary,
-            }
-        )
-        self._write_progress(progress)
+        entry = self._phase_entry(phase)
+        entry["status"] = "completed"
+        entry["completed_at"] = _now_iso()
+        entry["summary"] = summary
+        self._flush()
 
     def mark_phase_failed(self, phase: str, error: str = "") -> None:
         """Mark a phase as failed.
@@ -81,19 +105,11 @@ class ProgressTracker:
             phase: Phase name.
             error: Error message.
         """
-        progress = self.read_progress() or {"phases": {}}
-
-        if phase not in progress["phases"]:
-            progress["phases"][phase] = {}
-
-        progress["phases"][phase].update(
-            {
-                "status": "failed",
-                "failed_at": datetime.utcnow().isoformat() + "Z",
-                "error": error,
-            }
-        )
-        self._write_progress(progress)
+        entry = self._phase_entry(phase)
+        entry["status"] = "failed"
+        entry["failed_at"] = _now_iso()
+        entry["error"] = error
+        self._flush()
 
     def add_session_log(
         self, phase: str, session_id: str, model: str, turns: int = 0
@@ -106,34 +122,140 @@ class ProgressTracker:
             model: Claude model used.
             turns: Number of agent turns.
         """
-        progress = self.read_progress() or {"phases": {}}
-
-        if phase not in progress["phases"]:
-            progress["phases"][phase] = {}
-
-        if "sessions" not in progress["phases"][phase]:
-            progress["phases"][phase]["sessions"] = []
-
         session_log = {
             "session_id": session_id,
             "model": model,
             "turns": turns,
-            "logged_at": datetime.utcnow().isoformat() + "Z",
+            "logged_at": _now_iso(),
         }
-        progress["phases"][phase]["sessions"].append(session_log)
-        self._write_progress(progress)
+        if phase not in self._load()["phases"]:
+            self._phase_entry(phase)
+            self._flush()
+
+        # Append-only, so logging a session never rewrites earlier ones
+        line = dumps(session_log) + b"\n"
+        log_path = self.sessions_dir / f"{phase}.jsonl"
+        try:
+            log_file = open(log_path, "ab")
+        except FileNotFoundError:
+            self.sessions_dir.mkdir(exist_ok=True)
+            log_file = open(log_path, "ab")
+        with log_file:
+            log_file.write(line)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["ProgressTracker"]:
+        """Group several updates into a single write of the progress file.
+
+        Batches may nest; the file is written when the outermost one exits,
+        including when it exits with an exception, and only if something
+        changed.
+
+        Yields:
+            This tracker.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._write_pending()
 
     def read_progress(self) -> Optional[Dict[str, Any]]:
         """Read current progress.
 
         Returns:
-            Progress dictionary or None if file doesn't exist.
+            Copy of the progress dictionary, including session logs, or None
+            if file doesn't exist.
+        """
+        progress = self._current()
+        if progress is None:
+            return None
+
+        return self._with_sessions(copy.deepcopy(progress))
+
+    def _current(self) -> Optional[Dict[str, Any]]:
+        """Get the progress, re-reading the file if another writer changed it.
+
+        The in-memory copy is revalidated against the file's inode, mtime,
+        ctime and size, so trackers sharing a work dir see each other's
+        updates. Unsaved updates inside a batch are kept as-is.
+
+        Returns:
+            In-memory progress dictionary, or None if file doesn't exist.
         """
-        if not self.progress_file.exists():
+        if self._dirty:
+            return self._progress
+
+        try:
+            stat = os.stat(self.progress_file)
+        except FileNotFoundError:
+            self._progress = None
+            self._file_key = None
             return None
 
-        with open(self.progress_file) as f:
-            return json.load(f)
+        key = file_key(stat)
+        if self._progress is None or key != self._file_key:
+            progress: Dict[str, Any] = loads(self.progress_file.read_bytes())
+            self._progress = progress
+            self._file_key = key
+        return self._progress
+
+    def _with_sessions(self, progress: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the per-phase session logs into a copy of the progress.
+
+        Args:
+            progress: Progress dictionary from memory or disk.
+
+        Returns:
+            Progress with ``sessions`` lists attached to their phases.
+        """
+        if not self.sessions_dir.is_dir():
+            return progress
+
+        phases = dict(progress.get("phases", {}))
+        for log_path in sorted(self.sessions_dir.glob("*.jsonl")):
+            entry = dict(phases.get(log_path.stem, {}))
+            entry["sessions"] = entry.get("sessions", []) + [
+                loads(line) for line in log_path.read_bytes().splitlines() if line
+            ]
+            phases[log_path.stem] = entry
+        return {**progress, "phases": phases}
+
+    def _load(self) -> Dict[str, Any]:
+        """Get the up-to-date progress for an update.
+
+        Returns:
+            Mutable progress dictionary.
+        """
+        progress = self._current()
+        if progress is None:
+            progress = {"phases": {}}
+            self._progress = progress
+        return progress
+
+    def _phase_entry(self, phase: str) -> Dict[str, Any]:
+        """Get the progress entry for a phase, creating it if needed.
+
+        Args:
+            phase: Phase name.
+
+        Returns:
+            Mutable progress dictionary for the phase.
+        """
+        entry: Dict[str, Any] = self._load()["phases"].setdefault(phase, {})
+        return entry
+
+    def _flush(self) -> None:
+        """Record an update and write progress to disk unless a batch is open."""
+        self._dirty = True
+        self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write unsaved updates to disk unless a batch is open."""
+        if self._batch_depth == 0 and self._dirty and self._progress is not None:
+            self._write_progress(self._progress)
+            self._dirty = False
 
     def _write_progress(self, progress: Dict[str, Any]) -> None:
         """Write progress to file.
@@ -141,5 +263,6 @@ class ProgressTracker:
         Args:
             progress: Progress dictionary.
         """
-        with open(self.progress_file, "w") as f:
-            json.dump(progress, f, indent=2)
+        write_bytes_atomic(self.progress_file, dumps(progress, indent=True))
+        stat = os.stat(self.progress_file)
+        self._file_key = file_key(stat)
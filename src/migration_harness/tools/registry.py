@@ -1,16 +1,20 @@
 """MCP tool registry for agent sessions."""
 
-from typing import Any, Dict, Optional
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from migration_harness.config import load_config
-from migration_harness.schema import Config
+from migration_harness._json import dumps, loads
 from migration_harness.state.manager import StateManager
 
+if TYPE_CHECKING:
+    from migration_harness.schema import Config
+
 
 class ToolRegistry:
     """Registry of MCP tools for agent sessions."""
 
-    def __init__(self, config: Config, state_manager: StateManager):
+    def __init__(self, config: "Config", state_manager: StateManager):
         """Initialize tool registry.
 
         Args:
@@ -19,6 +23,33 @@ class ToolRegistry:
         """
         self.config = config
         self.state_manager = state_manager
+        # Encoded response of each config tool, keyed by tool
+        self._config_json: Optional[Dict[str, bytes]] = None
+        # ((path, mtime_ns, size), content) of the last schema read
+        self._schema_cache: Optional[Tuple[Tuple[str, int, int], str]] = None
+
+    def _config_response(self, tool: str) -> Dict[str, Any]:
+        """Decode a fresh copy of a config tool's response.
+
+        The config is fixed for the lifetime of a run, so it is dumped once
+        and each tool's response is encoded on first use. Every call decodes
+        only its own response, and callers never share a mutable dict.
+
+        Args:
+            tool: ``config``, ``endpoints`` or ``mappings``.
+
+        Returns:
+            JSON-compatible response dictionary.
+        """
+        if self._config_json is None:
+            config_dict = self.config.model_dump(mode="json")
+            self._config_json = {
+                "config": dumps(config_dict),
+                "endpoints": dumps({"endpoints": config_dict["rest_endpoints"]}),
+                "mappings": dumps({"mappings": config_dict["attribute_mappings"]}),
+            }
+        response: Dict[str, Any] = loads(self._config_json[tool])
+        return response
 
     def get_config(self) -> Dict[str, Any]:
         """Get configuration as JSON.
@@ -26,7 +57,7 @@ class ToolRegistry:
         Returns:
             Configuration dictionary.
         """
-        return self.config.model_dump()
+        return self._config_response("config")
 
     def get_endpoints(self) -> Dict[str, Any]:
         """Get REST endpoints configuration.
@@ -34,9 +65,7 @@ class ToolRegistry:
         Returns:
             REST endpoints dictionary.
         """
-        return {
-            "endpoints": [ep.model_dump() for ep in self.config.rest_endpoints]
-        }
+        return self._config_response("endpoints")
 
     def get_mappings(self) -> Dict[str, Any]:
         """Get attribute mappings configuration.
@@ -44,13 +73,14 @@ class ToolRegistry:
         Returns:
             Attribute mappings dictionary.
         """
-        return {
-            "mappings": [m.model_dump() for m in self.config.attribute_mappings]
-        }
+        return self._config_response("mappings")
 
     def get_graphql_schema(self) -> str:
         """Get GraphQL schema content.
 
+        The content is cached and only re-read when the file's path,
+        modification time or size changes.
+
         Returns:
             GraphQL schema content.
 
@@ -59,11 +89,42 @@ class ToolRegistry:
         """
         schema_path = self.config.graphql_schema_path
         try:
-            with open(schema_path) as f:
-                return f.read()
+            stat = os.stat(schema_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"GraphQL schema not found: {schema_path}")
 
+        # Re-read only if the path or the file itself changed
+        key = (schema_path, stat.st_mtime_ns, stat.st_size)
+        if self._schema_cache is None or self._schema_cache[0] != key:
+            # GraphQL documents are UTF-8; decode the bytes as-is rather than
+            # with the locale encoding and newline translation of read_text()
+            self._schema_cache = (key, Path(schema_path).read_bytes().decode("utf-8"))
+        return self._schema_cache[1]
+
+    def save_result(self, phase: str, result: Dict[str, Any]) -> Dict[str, str]:
+        """Save a phase result.
+
+        Args:
+            phase: Phase name.
+            result: Phase result to save.
+
+        Returns:
+            Confirmation message.
+        """
+        self.state_manager.save_result(phase, result)
+        return {"status": "saved", "phase": phase}
+
+    def get_result(self, phase: str) -> Optional[Dict[str, Any]]:
+        """Get a saved phase result.
+
+        Args:
+            phase: Phase name.
+
+        Returns:
+            Phase result or None if not found.
+        """
+        return self.state_manager.get_result(phase)
+
     def save_discovery_result(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Save discovery phase result.
 
@@ -73,8 +134,7 @@ class ToolRegistry:
         Returns:
             Confirmation message.
         """
-        self.state_manager.save_discovery_result(result)
-        return {"status": "saved", "phase": "discovery"}
+        return self.save_result("discovery", result)
 
     def get_discovery_result(self) -> Optional[Dict[str, Any]]:
         """Get saved discovery result.
@@ -82,7 +142,7 @@ class ToolRegistry:
         Returns:
             Discovery result or None if not found.
         """
-        return self.state_manager.get_discovery_result()
+        return self.get_result("discovery")
 
     def save_narrowing_result(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Save narrowing phase result.
@@ -93,8 +153,7 @@ class ToolRegistry:
         Returns:
             Confirmation message.
         """
-        self.state_manager.save_narrowing_result(result)
-        return {"status": "saved", "phase": "narrowing"}
+        return self.save_result("narrowing", result)
 
     def get_narrowing_result(self) -> Optional[Dict[str, Any]]:
         """Get saved narrowing result.
@@ -102,7 +161,7 @@ class ToolRegistry:
         Returns:
             Narrowing result or None if not found.
         """
-        return self.state_manager.get_narrowing_result()
+        return self.get_result("narrowing")
 
     def save_generation_result(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Save generation phase result.
@@ -113,8 +172,7 @@ class ToolRegistry:
         Returns:
             Confirmation message.
         """
-        self.state_manager.save_generation_result(result)
-        return {"status": "saved", "phase": "generation"}
+        return self.save_result("generation", result)
 
     def get_generation_result(self) -> Optional[Dict[str, Any]]:
         """Get saved generation result.
@@ -122,7 +180,7 @@ class ToolRegistry:
         Returns:
             Generation result or None if not found.
         """
-        return self.state_manager.get_generation_result()
+        return self.get_result("generation")
 
     def save_migration_result(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Save migration phase result.
@@ -133,8 +191,7 @@ class ToolRegistry:
         Returns:
             Confirmation message.
         """
-        self.state_manager.save_migration_result(result)
-        return {"status": "saved", "phase": "migration"}
+        return self.save_result("migration", result)
 
     def get_migration_result(self) -> Optional[Dict[str, Any]]:
         """Get saved migration result.
@@ -142,7 +199,7 @@ class ToolRegistry:
         Returns:
             Migration result or None if not found.
         """
-        return self.state_manager.get_migration_result()
+        return self.get_result("migration")
 
     def save_validation_result(self, result: Dict[str, Any]) -> Dict[str, str]:
         """Save validation phase result.
@@ -153,8 +210,7 @@ class ToolRegistry:
         Returns:
             Confirmation message.
         """
-        self.state_manager.save_validation_result(result)
-        return {"status": "saved", "phase": "validation"}
+        return self.save_result("validation", result)
 
     def get_validation_result(self) -> Optional[Dict[str, Any]]:
         """Get saved validation result.
@@ -162,4 +218,4 @@ class ToolRegistry:
         Returns:
             Validation result or None if not found.
         """
-        return self.state_manager.get_validation_result()
+        return self.get_result("validation")
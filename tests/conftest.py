@@ -1,12 +1,53 @@
 """Shared pytest fixtures for all tests."""
 
-import json
+import copy
 import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 import pytest
 
+from migration_harness._json import loads
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked 'integration' (they spawn git subprocesses)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration-marked tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session")
+def _fixture_json_cache() -> Dict[str, Any]:
+    """Parsed JSON fixture files, each read at most once per session."""
+    return {}
+
+
+@pytest.fixture
+def load_fixture_json(_fixture_json_cache) -> Callable[[str], Any]:
+    """Load a JSON file from tests/fixtures as a private deep copy."""
+
+    def load(name: str) -> Any:
+        if name not in _fixture_json_cache:
+            _fixture_json_cache[name] = loads((FIXTURES_DIR / name).read_bytes())
+        return copy.deepcopy(_fixture_json_cache[name])
+
+    return load
+
 
 @pytest.fixture
 def temp_dir():
@@ -15,9 +56,12 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def sample_config() -> Dict[str, Any]:
-    """Load sample migration configuration."""
+@pytest.fixture(scope="session")
+def _sample_config_raw() -> Dict[str, Any]:
+    """Sample migration configuration shared by the whole session.
+
+    Read-only: tests that mutate the config should use ``sample_config``.
+    """
     return {
         "project_name": "test-migration",
         "work_dir": "/tmp/test-workspace",
@@ -58,6 +102,12 @@ def sample_config() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_config(_sample_config_raw) -> Dict[str, Any]:
+    """Load sample migration configuration."""
+    return copy.deepcopy(_sample_config_raw)
+
+
 @pytest.fixture
 def sample_discovery_result() -> Dict[str, Any]:
     """Sample discovery phase output."""
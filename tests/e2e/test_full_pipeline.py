@@ -1,6 +1,5 @@
 """End-to-end tests for the full pipeline."""
 
-import json
 from pathlib import Path
 
 import pytest
@@ -13,14 +12,14 @@ from migration_harness.pipeline.gates import (
     validate_narrowing_gate,
 )
 
+SAMPLE_CONFIG_FIXTURE = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
+
 
 @pytest.mark.e2e
-def test_full_pipeline_with_fixtures(temp_dir):
+def test_full_pipeline_with_fixtures(temp_dir, load_fixture_json):
     """Test full pipeline flow with fixture data."""
     # Load fixture config
-    config_fixture = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
-    config = load_config(str(config_fixture))
-    config.work_dir = str(temp_dir)
+    config = load_config(str(SAMPLE_CONFIG_FIXTURE)).model_copy(update={"work_dir": str(temp_dir)})
 
     # Create orchestrator
     orchestrator = Orchestrator(config)
@@ -29,27 +28,21 @@ def test_full_pipeline_with_fixtures(temp_dir):
     orchestrator.progress_tracker.init_progress(config.project_name)
 
     # Simulate discovery phase
-    discovery_fixture = Path(__file__).parent.parent / "fixtures" / "sample_discovery.json"
-    with open(discovery_fixture) as f:
-        discovery_result = json.load(f)
+    discovery_result = load_fixture_json("sample_discovery.json")
 
     validate_discovery_gate(discovery_result)
     orchestrator.state_manager.save_discovery_result(discovery_result)
     orchestrator.progress_tracker.mark_phase_completed("discovery", "Found 5 usages")
 
     # Simulate narrowing phase
-    narrowed_fixture = Path(__file__).parent.parent / "fixtures" / "sample_narrowed.json"
-    with open(narrowed_fixture) as f:
-        narrowed_result = json.load(f)
+    narrowed_result = load_fixture_json("sample_narrowed.json")
 
     validate_narrowing_gate(narrowed_result)
     orchestrator.state_manager.save_narrowing_result(narrowed_result)
     orchestrator.progress_tracker.mark_phase_completed("narrowing", "Filtered to 3 usages")
 
     # Simulate generation phase
-    generated_fixture = Path(__file__).parent.parent / "fixtures" / "sample_generated.json"
-    with open(generated_fixture) as f:
-        generated_result = json.load(f)
+    generated_result = load_fixture_json("sample_generated.json")
 
     validate_generation_gate(generated_result)
     orchestrator.state_manager.save_generation_result(generated_result)
@@ -86,9 +79,7 @@ def test_full_pipeline_with_fixtures(temp_dir):
 @pytest.mark.e2e
 def test_pipeline_failure_handling(temp_dir):
     """Test pipeline error handling."""
-    config_fixture = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
-    config = load_config(str(config_fixture))
-    config.work_dir = str(temp_dir)
+    config = load_config(str(SAMPLE_CONFIG_FIXTURE)).model_copy(update={"work_dir": str(temp_dir)})
 
     orchestrator = Orchestrator(config)
     orchestrator.progress_tracker.init_progress(config.project_name)
@@ -105,9 +96,7 @@ def test_pipeline_failure_handling(temp_dir):
 @pytest.mark.e2e
 def test_pipeline_with_sessions(temp_dir):
     """Test pipeline with session logging."""
-    config_fixture = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
-    config = load_config(str(config_fixture))
-    config.work_dir = str(temp_dir)
+    config = load_config(str(SAMPLE_CONFIG_FIXTURE)).model_copy(update={"work_dir": str(temp_dir)})
 
     orchestrator = Orchestrator(config)
     orchestrator.progress_tracker.init_progress(config.project_name)
@@ -1,6 +1,5 @@
 """Integration tests for orchestrator."""
 
-import json
 from pathlib import Path
 
 import pytest
@@ -9,6 +8,8 @@ from migration_harness.config import load_config
 from migration_harness.orchestrator import Orchestrator
 from migration_harness.state.manager import StateManager
 
+SAMPLE_CONFIG_FIXTURE = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
+
 
 def test_orchestrator_initialization(sample_config, temp_dir):
     """Test orchestrator initialization."""
@@ -19,6 +20,32 @@ def test_orchestrator_initialization(sample_config, temp_dir):
     assert isinstance(orchestrator.state_manager, StateManager)
 
 
+def test_phase_runners_share_tool_registry(sample_config, temp_dir):
+    """Test that phase runners are built once and share one tool registry."""
+    sample_config["work_dir"] = str(temp_dir)
+    orchestrator = Orchestrator(load_config(sample_config))
+
+    runners = [orchestrator._runners[phase] for phase in Orchestrator.PHASES]
+    assert [runner.phase for runner in runners] == Orchestrator.PHASES
+    assert all(runner.tool_registry is orchestrator.tool_registry for runner in runners)
+
+
+def test_validate_phase_result_dispatches_to_gates(
+    sample_config, temp_dir, sample_discovery_result
+):
+    """Test that blocking phases run their gate and the rest pass through."""
+    sample_config["work_dir"] = str(temp_dir)
+    orchestrator = Orchestrator(load_config(sample_config))
+
+    assert orchestrator._validate_phase_result("discovery", sample_discovery_result)
+    assert not orchestrator._validate_phase_result(
+        "discovery", {"phase": "discovery", "usages": []}
+    )
+    # Migration and validation gates are non-blocking
+    assert orchestrator._validate_phase_result("migration", {})
+    assert orchestrator._validate_phase_result("validation", {})
+
+
 def test_state_manager_integration(sample_config, temp_dir):
     """Test state manager with orchestrator."""
     sample_config["work_dir"] = str(temp_dir)
@@ -47,39 +74,32 @@ def test_progress_tracking(sample_config, temp_dir):
 
 def test_config_from_fixture(temp_dir):
     """Test loading config from fixture file."""
-    fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_config.json"
-    config = load_config(str(fixture_path))
+    config = load_config(str(SAMPLE_CONFIG_FIXTURE))
 
     assert config.project_name == "test-rest-to-graphql"
     assert len(config.repositories) == 2
     assert len(config.rest_endpoints) == 2
 
 
-def test_discovery_fixture_loading(temp_dir):
+def test_discovery_fixture_loading(load_fixture_json):
     """Test loading discovery fixture."""
-    fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_discovery.json"
-    with open(fixture_path) as f:
-        discovery = json.load(f)
+    discovery = load_fixture_json("sample_discovery.json")
 
     assert discovery["phase"] == "discovery"
     assert len(discovery["usages"]) == 5
 
 
-def test_narrowed_fixture_loading(temp_dir):
+def test_narrowed_fixture_loading(load_fixture_json):
     """Test loading narrowed fixture."""
-    fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_narrowed.json"
-    with open(fixture_path) as f:
-        narrowed = json.load(f)
+    narrowed = load_fixture_json("sample_narrowed.json")
 
     assert narrowed["phase"] == "narrowing"
     assert len(narrowed["narrowed_usages"]) == 3
 
 
-def test_generated_fixture_loading(temp_dir):
+def test_generated_fixture_loading(load_fixture_json):
     """Test loading generated fixture."""
-    fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_generated.json"
-    with open(fixture_path) as f:
-        generated = json.load(f)
+    generated = load_fixture_json("sample_generated.json")
 
     assert generated["phase"] == "generation"
     assert len(generated["generated_migrations"]) == 3
@@ -1,42 +1,92 @@
 """Tests for RollbackManager — git-based savepoints and rollback."""
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Set
 
 import pytest
 
 from migration_harness.pipeline.rollback import RollbackManager
 
-
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create a minimal git repository for testing."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    # Set up git config globally for tests to avoid permission issues
-    subprocess.run(
-        ["git", "config", "--global", "user.email", "test@example.com"],
-        capture_output=True,
-    )
+# Minimal environment for the git commands the tests run themselves: a fixed
+# commit identity and no user/system config, so tests never read or write
+# ~/.gitconfig (which would also race between parallel workers).
+_GIT_ENV = {
+    "PATH": os.environ.get("PATH", os.defpath),
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_NOSYSTEM": "1",
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in the test repository.
+
+    Output is discarded; only stderr is kept, for the CalledProcessError
+    raised on failure.
+    """
     subprocess.run(
-        ["git", "config", "--global", "user.name", "Test User"],
-        capture_output=True,
+        ["git", *args],
+        cwd=repo,
+        env=_GIT_ENV,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
     )
 
+
+def _current_branch(repo: Path) -> str:
+    """Read the checked-out branch name straight from .git/HEAD."""
+    head = (repo / ".git" / "HEAD").read_text().strip()
+    return head.removeprefix("ref: refs/heads/")
+
+
+def _local_branches(repo: Path) -> Set[str]:
+    """List local branches from loose and packed refs without running git."""
+    heads = repo / ".git" / "refs" / "heads"
+    branches = {p.relative_to(heads).as_posix() for p in heads.rglob("*") if p.is_file()}
+    packed = repo / ".git" / "packed-refs"
+    if packed.exists():
+        for line in packed.read_text().splitlines():
+            _, _, ref = line.partition(" refs/heads/")
+            if ref:
+                branches.add(ref)
+    return branches
+
+
+def _commit_all(repo: Path, message: str) -> None:
+    """Stage everything and commit it."""
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", message)
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory) -> Path:
+    """Build a minimal git repository once per test session."""
+    repo = tmp_path_factory.mktemp("git-template") / "repo"
+    repo.mkdir()
+
     # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
+    _git(repo, "init")
 
     # Create initial commit
     (repo / "README.md").write_text("# Test Repo")
-    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo,
-        capture_output=True,
-        check=True,
-    )
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "Initial commit")
+
+    return repo
+
 
+@pytest.fixture
+def git_repo(git_repo_template: Path, tmp_path: Path) -> Path:
+    """Copy the template repository so each test gets its own."""
+    repo = tmp_path / "repo"
+    shutil.copytree(git_repo_template, repo)
     return repo
 
 
@@ -50,7 +100,6 @@ def rollback_manager(git_repo: Path) -> RollbackManager:
 class TestRollbackManager:
     """RollbackManager creates git savepoints and can rollback to them.
 
-    NOTE: These tests require git to be properly configured with user.email and user.name.
     They are marked as integration tests since they interact with the filesystem.
     """
 
@@ -65,16 +114,13 @@ class TestRollbackManager:
         """create_savepoint() actually creates a git branch."""
         branch = rollback_manager.create_savepoint("migration")
 
-        # List branches
-        result = subprocess.run(
-            ["git", "branch"],
-            cwd=git_repo,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branches = result.stdout
-        assert branch in branches or branch.strip() in branches
+        assert branch in _local_branches(git_repo)
+
+    def test_create_savepoint_checks_out_branch(self, rollback_manager, git_repo):
+        """create_savepoint() leaves the repository on the savepoint branch."""
+        branch = rollback_manager.create_savepoint("migration")
+
+        assert _current_branch(git_repo) == branch
 
     def test_can_create_multiple_savepoints(self, rollback_manager):
         """Can create multiple savepoints for different phases."""
@@ -94,56 +140,32 @@ class TestRollbackManager:
 
         # Make a change on main branch
         (git_repo / "file.txt").write_text("modified")
-        subprocess.run(["git", "add", "."], cwd=git_repo, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Modification"],
-            cwd=git_repo,
-            capture_output=True,
-            check=True,
-        )
+        _commit_all(git_repo, "Modification")
 
         # Rollback to savepoint
         rollback_manager.rollback_to_savepoint(branch)
 
         # Verify we're on the savepoint branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=git_repo,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        current_branch = result.stdout.strip()
-        assert current_branch == branch
+        assert _current_branch(git_repo) == branch
 
     # ── Delete savepoint ────────────────────────────────────────────────────
 
     def test_delete_savepoint(self, rollback_manager, git_repo):
         """delete_savepoint() removes the branch."""
+        original = _current_branch(git_repo)
         branch = rollback_manager.create_savepoint("cleanup")
 
         # Verify branch exists
-        result = subprocess.run(
-            ["git", "branch"],
-            cwd=git_repo,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        assert branch in result.stdout
+        assert branch in _local_branches(git_repo)
+
+        # git refuses to delete the checked-out branch, so leave it first
+        _git(git_repo, "checkout", original)
 
         # Delete it
         rollback_manager.delete_savepoint(branch)
 
         # Verify it's gone
-        result = subprocess.run(
-            ["git", "branch"],
-            cwd=git_repo,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        assert branch not in result.stdout
+        assert branch not in _local_branches(git_repo)
 
     def test_delete_nonexistent_savepoint_doesnt_error(self, rollback_manager):
         """delete_savepoint() on a non-existent branch doesn't raise."""
@@ -172,13 +194,7 @@ class TestRollbackManager:
 
         # Make a change
         (git_repo / "file.txt").write_text("content")
-        subprocess.run(["git", "add", "."], cwd=git_repo, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Change"],
-            cwd=git_repo,
-            capture_output=True,
-            check=True,
-        )
+        _commit_all(git_repo, "Change")
 
         commit2 = rollback_manager.get_current_commit()
 
@@ -13,10 +13,10 @@ from migration_harness.agents.prompts import (
 from migration_harness.schema import Config
 
 
-@pytest.fixture
-def agent_defs(sample_config) -> AgentDefinitions:
-    """Create AgentDefinitions with sample config."""
-    config = Config(**sample_config)
+@pytest.fixture(scope="module")
+def agent_defs(_sample_config_raw) -> AgentDefinitions:
+    """Create AgentDefinitions with sample config, shared by the module."""
+    config = Config(**_sample_config_raw)
     return AgentDefinitions(config)
 
 
@@ -61,12 +61,20 @@ class TestAgentDefinitions:
         assert "validat" in prompt.lower()
 
     def test_prompts_match_prompt_module(self, agent_defs):
-        """Prompts return the exact strings from prompts.py."""
-        assert agent_defs.get_discovery_prompt() == DISCOVERY_SYSTEM_PROMPT
-        assert agent_defs.get_narrowing_prompt() == NARROWING_SYSTEM_PROMPT
-        assert agent_defs.get_generation_prompt() == GENERATION_SYSTEM_PROMPT
-        assert agent_defs.get_migration_prompt() == MIGRATION_SYSTEM_PROMPT
-        assert agent_defs.get_validation_prompt() == VALIDATION_SYSTEM_PROMPT
+        """Prompts are the prompts.py constants themselves, not copies."""
+        assert agent_defs.get_discovery_prompt() is DISCOVERY_SYSTEM_PROMPT
+        assert agent_defs.get_narrowing_prompt() is NARROWING_SYSTEM_PROMPT
+        assert agent_defs.get_generation_prompt() is GENERATION_SYSTEM_PROMPT
+        assert agent_defs.get_migration_prompt() is MIGRATION_SYSTEM_PROMPT
+        assert agent_defs.get_validation_prompt() is VALIDATION_SYSTEM_PROMPT
+
+    def test_fields_are_precomputed(self, agent_defs):
+        """Prompts and options are exposed as immutable fields."""
+        assert agent_defs.discovery is DISCOVERY_SYSTEM_PROMPT
+        assert agent_defs.model == "claude-sonnet-4-5-20250929"
+        assert agent_defs.max_turns == 50
+        with pytest.raises(AttributeError):
+            agent_defs.model = "other-model"
 
     # ── Configuration ──────────────────────────────────────────────────────
 
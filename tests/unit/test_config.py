@@ -4,8 +4,9 @@ import json
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from migration_harness.config import load_config
+from migration_harness.config import _read_cached, load_config
 from migration_harness.schema import Config
 
 
@@ -16,14 +17,15 @@ def test_load_config_from_dict(sample_config):
     assert config.project_name == "test-migration"
 
 
-def test_load_config_from_file(sample_config, tmp_path):
-    """Test loading config from JSON file."""
+@pytest.mark.parametrize("as_source", [str, Path, Path.read_bytes], ids=["str", "path", "bytes"])
+def test_load_config_from_file(sample_config, tmp_path, as_source):
+    """Test loading config from a JSON file path or its raw bytes."""
     config_file = tmp_path / "config.json"
     config_file.write_text(json.dumps(sample_config))
 
-    config = load_config(str(config_file))
+    config = load_config(as_source(config_file))
     assert isinstance(config, Config)
-    assert config.project_name == "test-migration"
+    assert config == load_config(sample_config)
 
 
 def test_load_config_validates_schema(tmp_path):
@@ -40,3 +42,44 @@ def test_load_config_file_not_found():
     """Test that loading from non-existent file raises error."""
     with pytest.raises((FileNotFoundError, ValueError)):
         load_config("/nonexistent/path/config.json")
+
+
+def test_load_config_caches_unchanged_file(sample_config, tmp_path):
+    """Test that reloading an unchanged file skips the read."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(sample_config))
+
+    first = load_config(str(config_file))
+    hits = _read_cached.cache_info().hits
+    second = load_config(str(config_file))
+
+    assert _read_cached.cache_info().hits == hits + 1
+    assert second == first
+    assert second is not first
+    with pytest.raises(ValidationError):
+        first.work_dir = "/somewhere/else"
+
+
+def test_load_config_cache_is_not_shared(sample_config, tmp_path):
+    """Mutating a loaded config's lists does not affect later loads."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(sample_config))
+
+    load_config(str(config_file)).repositories.clear()
+    load_config(str(config_file)).rest_endpoints[0].patterns.append("/extra")
+
+    config = load_config(str(config_file))
+    assert len(config.repositories) == len(sample_config["repositories"])
+    assert config.rest_endpoints[0].patterns == sample_config["rest_endpoints"][0]["patterns"]
+
+
+def test_load_config_reloads_modified_file(sample_config, tmp_path):
+    """Test that the cache is invalidated when the file changes."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(sample_config))
+    assert load_config(str(config_file)).project_name == "test-migration"
+
+    sample_config["project_name"] = "renamed-migration"
+    config_file.write_text(json.dumps(sample_config))
+
+    assert load_config(str(config_file)).project_name == "renamed-migration"
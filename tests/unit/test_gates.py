@@ -10,63 +10,66 @@ from migration_harness.pipeline.gates import (
 )
 
 
-def test_discovery_gate_valid(sample_discovery_result):
-    """Test discovery gate with valid result."""
-    validate_discovery_gate(sample_discovery_result)  # Should not raise
 
 
-def test_discovery_gate_empty_usages():
-    """Test discovery gate with empty usages."""
-    result = {"phase": "discovery", "usages": []}
-    with pytest.raises(GateError):
-        validate_discovery_gate(result)
-
-
-def test_discovery_gate_missing_phase():
-    """Test discovery gate with missing phase."""
-    result = {"usages": []}
-    with pytest.raises(GateError):
-        validate_discovery_gate(result)
-
-
-def test_narrowing_gate_valid(sample_narrowed_result):
-    """Test narrowing gate with valid result."""
-    validate_narrowing_gate(sample_narrowed_result)  # Should not raise
-
-
-def test_narrowing_gate_empty_usages():
-    """Test narrowing gate with empty usages."""
-    result = {"phase": "narrowing", "narrowed_usages": []}
-    with pytest.raises(GateError):
-        validate_narrowing_gate(result)
-
-
-def test_generation_gate_valid(sample_generated_result):
-    """Test generation gate with valid result."""
-    validate_generation_gate(sample_generated_result)  # Should not raise
+def _migration(**overrides):
+    """Build a generated migration entry with the given fields replaced."""
+    return {
+        "endpoint_id": "test",
+        "repo": "test-repo",
+        "file": "test.js",
+        "graphql_query": "query { user { id } }",
+        "new_code": "code",
+        "imports": [],
+        **overrides,
+    }
 
 
-def test_generation_gate_empty_migrations():
-    """Test generation gate with empty migrations."""
-    result = {"phase": "generation", "generated_migrations": []}
-    with pytest.raises(GateError):
-        validate_generation_gate(result)
+INVALID_RESULTS = [
+    pytest.param(
+        validate_discovery_gate, {"phase": "discovery", "usages": []}, None,
+        id="discovery-empty-usages",
+    ),
+    pytest.param(validate_discovery_gate, {"usages": []}, None, id="discovery-missing-phase"),
+    pytest.param(
+        validate_narrowing_gate, {"phase": "narrowing", "narrowed_usages": []}, None,
+        id="narrowing-empty-usages",
+    ),
+    pytest.param(
+        validate_generation_gate, {"phase": "generation", "generated_migrations": []}, None,
+        id="generation-empty-migrations",
+    ),
+    pytest.param(
+        validate_generation_gate,
+        {"phase": "generation", "generated_migrations": [_migration(graphql_query="")]},
+        None,
+        id="generation-missing-query",
+    ),
+    pytest.param(
+        validate_generation_gate,
+        {"phase": "generation", "generated_migrations": [_migration(new_code=" \n\t")]},
+        "new_code",
+        id="generation-whitespace-new-code",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "gate,fixture_name",
+    [
+        (validate_discovery_gate, "sample_discovery_result"),
+        (validate_narrowing_gate, "sample_narrowed_result"),
+        (validate_generation_gate, "sample_generated_result"),
+    ],
+    ids=["discovery", "narrowing", "generation"],
+)
+def test_gate_accepts_valid_result(gate, fixture_name, request):
+    """Each gate passes its phase's sample result."""
+    gate(request.getfixturevalue(fixture_name))  # Should not raise
 
 
-def test_generation_gate_missing_query():
-    """Test generation gate with missing graphql_query."""
-    result = {
-        "phase": "generation",
-        "generated_migrations": [
-            {
-                "endpoint_id": "test",
-                "repo": "test-repo",
-                "file": "test.js",
-                "graphql_query": "",  # Empty query
-                "new_code": "code",
-                "imports": [],
-            }
-        ],
-    }
-    with pytest.raises(GateError):
-        validate_generation_gate(result)
+@pytest.mark.parametrize("gate,result,match", INVALID_RESULTS)
+def test_gate_rejects_invalid_result(gate, result, match):
+    """Each gate raises GateError for empty or incomplete results."""
+    with pytest.raises(GateError, match=match):
+        gate(result)
@@ -1,10 +1,12 @@
 """
 Unit tests for GradleRunner.
 
-These tests cover the JUnit XML parsing logic only — they do NOT invoke
-Gradle or require a JDK.  The subprocess path is tested at integration level.
+These tests cover the JUnit XML parsing logic and output handling — they do
+NOT invoke Gradle or require a JDK (output streaming uses a shell stub on
+PATH).  The real Gradle path is tested at integration level.
 """
 
+import os
 import textwrap
 from pathlib import Path
 
@@ -107,6 +109,30 @@ def test_parse_failing_test(gradle_project: Path, report_dir: Path) -> None:
     assert "hardcoded" in checks[0].details
 
 
+def test_parse_errored_test(gradle_project: Path, report_dir: Path) -> None:
+    """
+    THINKING: An <error> child (exception outside an assertion) fails the
+    test just like <failure>; other children such as <system-out> are
+    ignored.
+    """
+    _write_junit_xml(report_dir, "TEST-ApiClientTest.xml", """\
+        <?xml version="1.0" encoding="UTF-8"?>
+        <testsuite name="com.example.ApiClientTest" tests="1" errors="1">
+          <testcase classname="com.example.ApiClientTest" name="T4" time="0.001">
+            <system-out>connecting...</system-out>
+            <error message="java.net.ConnectException: Connection refused"/>
+          </testcase>
+        </testsuite>
+    """)
+
+    runner = GradleRunner(str(gradle_project))
+    checks = runner._parse_junit_xml()
+
+    assert len(checks) == 1
+    assert checks[0].passed is False
+    assert "Connection refused" in checks[0].details
+
+
 # ── XML parsing: skipped test ─────────────────────────────────────────────────
 
 def test_parse_skipped_test(gradle_project: Path, report_dir: Path) -> None:
@@ -160,6 +186,64 @@ def test_parse_multiple_xml_files(gradle_project: Path, report_dir: Path) -> Non
 
     assert len(checks) == 3
     assert all(c.passed for c in checks)
+    # Files are parsed concurrently but reported in sorted file order
+    assert [c.check_name for c in checks] == [
+        "com.example.AnotherTest.A1",
+        "com.example.AnotherTest.A2",
+        "com.example.ApiClientTest.T1",
+    ]
+
+
+# ── malformed report file ─────────────────────────────────────────────────────
+
+def test_malformed_xml_file_is_skipped(gradle_project: Path, report_dir: Path) -> None:
+    """
+    THINKING: Parsing is streamed, so a truncated file could yield a partial
+    set of checks.  A malformed file must contribute nothing, while the
+    other report files are still parsed.
+    """
+    _write_junit_xml(report_dir, "TEST-Broken.xml", """\
+        <?xml version="1.0" encoding="UTF-8"?>
+        <testsuite name="com.example.Broken" tests="2">
+          <testcase classname="com.example.Broken" name="B1" time="0.01"/>
+          <testcase classname="com.example.Broken"
+    """)
+    _write_junit_xml(report_dir, "TEST-Good.xml", """\
+        <?xml version="1.0" encoding="UTF-8"?>
+        <testsuite name="com.example.Good" tests="1">
+          <testcase classname="com.example.Good" name="G1" time="0.01"/>
+        </testsuite>
+    """)
+
+    runner = GradleRunner(str(gradle_project))
+    checks = runner._parse_junit_xml()
+
+    assert [c.check_name for c in checks] == ["com.example.Good.G1"]
+
+
+# ── non-report files ──────────────────────────────────────────────────────────
+
+def test_only_test_report_files_are_parsed(gradle_project: Path, report_dir: Path) -> None:
+    """
+    THINKING: Gradle names one report per class TEST-<class>.xml; other XML
+    in the directory is not one of its reports and must not be read.
+    """
+    _write_junit_xml(report_dir, "TEST-Good.xml", """\
+        <?xml version="1.0" encoding="UTF-8"?>
+        <testsuite name="com.example.Good" tests="1">
+          <testcase classname="com.example.Good" name="G1" time="0.01"/>
+        </testsuite>
+    """)
+    _write_junit_xml(report_dir, "results.xml", """\
+        <testsuite name="com.example.Other" tests="1">
+          <testcase classname="com.example.Other" name="O1" time="0.01"/>
+        </testsuite>
+    """)
+
+    runner = GradleRunner(str(gradle_project))
+    checks = runner._parse_junit_xml()
+
+    assert [c.check_name for c in checks] == ["com.example.Good.G1"]
 
 
 # ── no report directory ───────────────────────────────────────────────────────
@@ -177,7 +261,7 @@ def test_returns_empty_list_when_no_reports(gradle_project: Path) -> None:
 
 # ── synthetic check on build failure ─────────────────────────────────────────
 
-def test_run_tests_synthetic_check_on_compile_error(gradle_project: Path) -> None:
+def test_run_tests_synthetic_check_on_compile_error(gradle_project: Path, monkeypatch) -> None:
     """
     THINKING: When Gradle itself fails (non-zero exit) and produces no XML,
     run_tests() must still return at least one ValidationCheck so the
@@ -187,9 +271,12 @@ def test_run_tests_synthetic_check_on_compile_error(gradle_project: Path) -> Non
     """
     runner = GradleRunner(str(gradle_project))
 
-    # Monkey-patch to simulate compile failure with no XML output
-    runner._invoke_gradle = lambda _: (False, "error: package does not exist")
-    runner._parse_junit_xml = lambda: []
+    # Monkey-patch to simulate compile failure with no XML output. GradleRunner
+    # uses __slots__, so methods are patched on the class.
+    monkeypatch.setattr(
+        GradleRunner, "_invoke_gradle", lambda self, _: (False, "error: package does not exist")
+    )
+    monkeypatch.setattr(GradleRunner, "_parse_junit_xml", lambda self: [])
 
     checks = runner.run_tests()
 
@@ -197,3 +284,29 @@ def test_run_tests_synthetic_check_on_compile_error(gradle_project: Path) -> Non
     assert checks[0].check_name == "gradle-build"
     assert checks[0].passed is False
     assert "package does not exist" in checks[0].details
+
+
+def test_invoke_gradle_keeps_only_output_tail(
+    gradle_project: Path, tmp_path: Path, monkeypatch
+) -> None:
+    """Only the last OUTPUT_TAIL_LINES lines of Gradle output are returned."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_gradle = bin_dir / "gradle"
+    fake_gradle.write_text(
+        "#!/bin/sh\n"
+        "for i in $(seq 1 500); do echo \"line $i\"; done\n"
+        "echo oops >&2\n"
+        "exit 1\n"
+    )
+    fake_gradle.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    runner = GradleRunner(str(gradle_project))
+    success, output = runner._invoke_gradle([])
+
+    lines = output.splitlines()
+    assert success is False
+    assert len(lines) == GradleRunner.OUTPUT_TAIL_LINES
+    assert lines[-1] == "oops"
+    assert "line 1\n" not in output
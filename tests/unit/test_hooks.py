@@ -2,6 +2,7 @@
 
 import pytest
 
+from migration_harness.hooks import validation_gates
 from migration_harness.hooks.security import validate_bash_command, DANGEROUS_COMMANDS, SAFE_COMMANDS
 from migration_harness.hooks.validation_gates import (
     validate_discovery_output,
@@ -65,6 +66,12 @@ class TestBashSecurity:
         assert error is not None
         assert "blocked" in error.lower() or "dangerous" in error.lower()
 
+    def test_dangerous_operation_after_safe_prefix_blocked(self):
+        """A dangerous operation chained after a safe command is still caught."""
+        error = validate_bash_command("git status && rm -rf /tmp/work")
+        assert error is not None
+        assert "'rm -rf'" in error
+
     def test_disallowed_command_returns_error(self):
         """Commands not in safe list return error."""
         error = validate_bash_command("ruby -e 'puts 1'")
@@ -76,6 +83,13 @@ class TestBashSecurity:
         error = validate_bash_command("")
         assert error is not None
 
+    def test_repeated_command_is_cached(self):
+        """Validating the same command twice is served from the cache."""
+        validate_bash_command.cache_clear()
+        validate_bash_command("git status")
+        validate_bash_command("git status")
+        assert validate_bash_command.cache_info().hits == 1
+
     def test_error_message_is_descriptive(self):
         """Error messages help the developer understand why the command is blocked."""
         # Dangerous pattern
@@ -184,3 +198,56 @@ class TestGenerationOutputValidation:
     def test_invalid_json_fails(self):
         output = "{broken json"
         assert validate_generation_output(output) is False
+
+
+class TestValidationCache:
+    """Passing serialized outputs are memoized per phase."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        validation_gates._VALIDATED.clear()
+        yield
+        validation_gates._VALIDATED.clear()
+
+    def test_repeated_valid_output_skips_parse(self, monkeypatch):
+        """A repeated valid output is answered from the cache."""
+        output = '{"phase": "discovery", "usages": []}'
+        assert validate_discovery_output(output) is True
+
+        def fail_loads(_):
+            raise AssertionError("output was parsed again")
+
+        monkeypatch.setattr(validation_gates, "loads", fail_loads)
+        assert validate_discovery_output(output) is True
+
+    def test_dict_output_is_not_parsed(self, monkeypatch):
+        """Decoded dict output is validated without any JSON call."""
+        def fail_loads(_):
+            raise AssertionError("dict output was parsed")
+
+        monkeypatch.setattr(validation_gates, "loads", fail_loads)
+        output = {"phase": "generation", "generated_migrations": []}
+        assert validate_generation_output(output) is True
+
+    def test_cache_is_keyed_by_phase(self):
+        """Output cached for one phase is still checked for another."""
+        output = '{"phase": "discovery", "usages": []}'
+        assert validate_discovery_output(output) is True
+        assert validate_narrowing_output(output) is False
+
+    def test_invalid_output_is_not_cached(self):
+        """Failed validations are not stored."""
+        validate_generation_output("{broken json")
+        assert len(validation_gates._VALIDATED) == 0
+
+    def test_lone_surrogate_output_fails_validation(self):
+        """Output that can't be encoded as UTF-8 is rejected, not raised."""
+        output = '{"phase": "discovery", "usages": ["\ud800"]}'
+        assert validate_discovery_output(output) is False
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """The cache evicts the oldest entries beyond its size limit."""
+        monkeypatch.setattr(validation_gates, "_VALIDATED_MAX", 2)
+        for i in range(3):
+            validate_discovery_output(f'{{"phase": "discovery", "usages": [{i}]}}')
+        assert len(validation_gates._VALIDATED) == 2
@@ -1,5 +1,7 @@
 """Tests for progress tracking."""
 
+import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -106,3 +108,138 @@ def test_progress_file_format(progress_tracker):
     data = __import__("json").loads(content)
     assert "project" in data
     assert "phases" in data
+
+
+def test_batch_writes_once(progress_tracker, monkeypatch):
+    """Updates inside batch() share a single write at the end."""
+    progress_tracker.init_progress("test-migration")
+    writes = []
+    original_write = progress_tracker._write_progress
+    monkeypatch.setattr(
+        progress_tracker, "_write_progress", lambda p: writes.append(p) or original_write(p)
+    )
+
+    with progress_tracker.batch():
+        progress_tracker.mark_phase_started("discovery")
+        progress_tracker.add_session_log("discovery", "session_123", "claude-sonnet-4-5")
+        progress_tracker.mark_phase_completed("discovery", "done")
+        assert writes == []
+        # In-memory progress is visible before the batch is written
+        assert progress_tracker.read_progress()["phases"]["discovery"]["status"] == "completed"
+
+    assert len(writes) == 1
+    on_disk = ProgressTracker(work_dir=str(progress_tracker.work_dir)).read_progress()
+    assert on_disk["phases"]["discovery"]["status"] == "completed"
+    assert len(on_disk["phases"]["discovery"]["sessions"]) == 1
+
+
+def test_batch_writes_on_error(progress_tracker):
+    """A batch that raises still persists the updates made so far."""
+    progress_tracker.init_progress("test-migration")
+
+    with pytest.raises(RuntimeError):
+        with progress_tracker.batch():
+            progress_tracker.mark_phase_failed("discovery", "boom")
+            raise RuntimeError("boom")
+
+    on_disk = ProgressTracker(work_dir=str(progress_tracker.work_dir)).read_progress()
+    assert on_disk["phases"]["discovery"]["status"] == "failed"
+
+
+def test_batch_without_updates_does_not_write(progress_tracker, monkeypatch):
+    """A batch that changes nothing leaves the progress file alone."""
+    progress_tracker.init_progress("test-migration")
+    writes = []
+    monkeypatch.setattr(progress_tracker, "_write_progress", writes.append)
+
+    with progress_tracker.batch():
+        progress_tracker.read_progress()
+
+    assert writes == []
+
+
+def test_timestamps_are_iso_utc(progress_tracker):
+    """Timestamps are ISO 8601 UTC strings ending in 'Z'."""
+    progress_tracker.init_progress("test-migration")
+    started_at = progress_tracker.read_progress()["started_at"]
+
+    assert started_at.endswith("Z")
+    parsed = datetime.fromisoformat(started_at[:-1])
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert abs((now - parsed).total_seconds()) < 60
+
+
+def test_session_logs_are_appended_to_jsonl(progress_tracker):
+    """Session logs go to an append-only per-phase file, not the progress file."""
+    progress_tracker.init_progress("test-migration")
+    progress_tracker.mark_phase_started("discovery")
+    progress_tracker.add_session_log("discovery", "session_1", "claude-sonnet-4-5", turns=3)
+    progress_tracker.add_session_log("discovery", "session_2", "claude-sonnet-4-5", turns=5)
+
+    log_lines = (progress_tracker.sessions_dir / "discovery.jsonl").read_text().splitlines()
+    assert len(log_lines) == 2
+    assert "sessions" not in progress_tracker.progress_file.read_text()
+
+    # A fresh tracker sees the merged sessions in order
+    progress = ProgressTracker(work_dir=str(progress_tracker.work_dir)).read_progress()
+    sessions = progress["phases"]["discovery"]["sessions"]
+    assert [s["session_id"] for s in sessions] == ["session_1", "session_2"]
+    assert progress["phases"]["discovery"]["status"] == "in_progress"
+
+
+def test_init_progress_clears_session_logs(progress_tracker):
+    """Re-initializing a work dir drops the previous run's sessions."""
+    progress_tracker.init_progress("first-project")
+    progress_tracker.add_session_log("discovery", "s1", "claude-sonnet-4-5")
+
+    progress_tracker.init_progress("second-project")
+    progress_tracker.mark_phase_started("discovery")
+    progress = progress_tracker.read_progress()
+
+    assert progress["phases"]["discovery"].get("sessions", []) == []
+
+
+def test_read_progress_returns_a_copy(progress_tracker):
+    """Mutating the returned progress does not change what is persisted."""
+    progress_tracker.init_progress("test-migration")
+    progress_tracker.mark_phase_started("discovery")
+
+    progress = progress_tracker.read_progress()
+    progress["project"] = "changed"
+    progress["phases"]["discovery"]["status"] = "changed"
+    progress_tracker.mark_phase_started("narrowing")
+
+    progress = ProgressTracker(work_dir=str(progress_tracker.work_dir)).read_progress()
+    assert progress["project"] == "test-migration"
+    assert progress["phases"]["discovery"]["status"] == "in_progress"
+
+
+def test_trackers_sharing_a_work_dir_keep_each_others_updates(temp_dir):
+    """An update re-reads progress written by another tracker first."""
+    tracker_a = ProgressTracker(work_dir=str(temp_dir))
+    tracker_b = ProgressTracker(work_dir=str(temp_dir))
+    tracker_a.init_progress("test-migration")
+    tracker_a.mark_phase_started("discovery")
+
+    tracker_b.mark_phase_completed("discovery", "done")
+    tracker_a.mark_phase_started("narrowing")
+
+    phases = ProgressTracker(work_dir=str(temp_dir)).read_progress()["phases"]
+    assert phases["discovery"]["status"] == "completed"
+    assert phases["narrowing"]["status"] == "in_progress"
+
+
+def test_same_size_rewrite_in_same_mtime_tick_is_picked_up(temp_dir):
+    """A replaced progress file is re-read even if its size and mtime match."""
+    tracker_a = ProgressTracker(work_dir=str(temp_dir))
+    tracker_a.init_progress("project-a")
+    mtime_ns = tracker_a.progress_file.stat().st_mtime_ns
+    started_at = tracker_a.read_progress()["started_at"]
+
+    # One write with the same length, differing only in the project name
+    tracker_b = ProgressTracker(work_dir=str(temp_dir))
+    tracker_b._progress = {"project": "project-b", "started_at": started_at, "phases": {}}
+    tracker_b._flush()
+    os.utime(tracker_a.progress_file, ns=(mtime_ns, mtime_ns))
+
+    assert tracker_a.read_progress()["project"] == "project-b"
@@ -0,0 +1,110 @@
+"""Tests for the phase runner."""
+
+import asyncio
+
+import pytest
+
+from migration_harness.config import load_config
+from migration_harness.pipeline.runner import PhaseRunner
+from migration_harness.state.manager import StateManager
+from migration_harness.state.progress import ProgressTracker
+
+
+class FakeRepoRunner(PhaseRunner):
+    """PhaseRunner whose per-repo step records concurrency."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = 0
+        self.max_active = 0
+
+    async def _execute_for_repo(self, repo):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if repo.name == "repo-2":
+            return None
+        return {
+            "phase": "discovery",
+            "timestamp": f"{repo.name}-time",
+            "usages": [{"repo": repo.name}],
+        }
+
+
+class FailingRepoRunner(PhaseRunner):
+    """PhaseRunner whose first repository raises while the others wait."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cancelled = []
+
+    async def _execute_for_repo(self, repo):
+        if repo.name == "repo-0":
+            raise RuntimeError("clone failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled.append(repo.name)
+            raise
+        return None
+
+
+@pytest.fixture
+def multi_repo_config(sample_config, temp_dir):
+    """Config with several repositories and a concurrency cap of 2."""
+    sample_config["work_dir"] = str(temp_dir)
+    sample_config["repositories"] = [
+        {**sample_config["repositories"][0], "name": f"repo-{i}"}
+        for i in range(5)
+    ]
+    return load_config(sample_config)
+
+
+def make_runner(config, phase, runner_cls=PhaseRunner):
+    """Build a runner for the given phase."""
+    return runner_cls(
+        config,
+        StateManager(work_dir=config.work_dir),
+        ProgressTracker(work_dir=config.work_dir),
+        phase,
+    )
+
+
+async def test_per_repo_phase_merges_results_in_repo_order(multi_repo_config):
+    """Per-repo results are concatenated in repository order, skipping failures."""
+    runner = make_runner(multi_repo_config, "discovery", FakeRepoRunner)
+    result = await runner._execute_phase()
+
+    assert result["phase"] == "discovery"
+    # Scalar fields come from the first successful repository
+    assert result["timestamp"] == "repo-0-time"
+    assert [u["repo"] for u in result["usages"]] == [
+        "repo-0", "repo-1", "repo-3", "repo-4"
+    ]
+
+
+async def test_per_repo_phase_respects_concurrency_limit(multi_repo_config):
+    """No more than max_concurrent_repos repositories run at once."""
+    runner = make_runner(multi_repo_config, "discovery", FakeRepoRunner)
+    await runner._execute_phase()
+
+    assert runner.max_active == multi_repo_config.options.max_concurrent_repos
+
+
+async def test_per_repo_phase_returns_none_when_all_repos_fail(multi_repo_config):
+    """A phase with no per-repo results yields None."""
+    runner = make_runner(multi_repo_config, "discovery")
+    assert await runner._execute_phase() is None
+
+
+async def test_per_repo_failure_cancels_other_repos(multi_repo_config):
+    """An error in one repository cancels the rest before it propagates."""
+    runner = make_runner(multi_repo_config, "discovery", FailingRepoRunner)
+
+    with pytest.raises(RuntimeError, match="clone failed"):
+        await runner._execute_phase()
+
+    assert "repo-1" in runner.cancelled
+    # No repository task is left running after the error
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -1,5 +1,7 @@
 """Tests for schema models."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -17,6 +19,7 @@ from migration_harness.schema import (
     RestEndpoint,
     ValidationCheck,
     ValidationResult,
+    validate_phase_result,
 )
 
 
@@ -36,6 +39,29 @@ class TestRestEndpoint:
         assert endpoint.path == "/api/v1/users/{id}"
         assert len(endpoint.patterns) == 2
 
+    def test_match_any_finds_first_pattern(self):
+        """match_any() returns the first pattern occurring in the text."""
+        endpoint = RestEndpoint(
+            id="get-user",
+            method="GET",
+            path="/api/v1/users/{id}",
+            patterns=["fetch('/api/v1/users/", "axios.get('/api/v1/users/"],
+        )
+        source = "const a = 1;\nconst u = await axios.get('/api/v1/users/' + id);"
+        assert endpoint.match_any(source) == "axios.get('/api/v1/users/"
+        assert endpoint.match_any("const a = fetch('/api/v1/orders/');") is None
+
+    def test_match_any_treats_patterns_literally(self):
+        """Regex metacharacters in patterns are matched literally."""
+        endpoint = RestEndpoint(
+            id="get-user",
+            method="GET",
+            path="/api/v1/users/{id}",
+            patterns=["users/(id)"],
+        )
+        assert endpoint.match_any("GET users/(id)") == "users/(id)"
+        assert endpoint.match_any("GET users/id") is None
+
     def test_rest_endpoint_missing_id(self):
         """Test that id is required."""
         with pytest.raises(ValidationError):
@@ -126,6 +152,12 @@ class TestConfigOptions:
         assert options.dry_run is True
         assert options.create_branches is True
 
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_max_concurrent_repos_must_be_positive(self, value):
+        """A concurrency limit below 1 would block every repository."""
+        with pytest.raises(ValidationError):
+            ConfigOptions(max_concurrent_repos=value)
+
 
 class TestConfig:
     """Tests for Config model."""
@@ -287,3 +319,24 @@ class TestValidationResult:
         )
         assert result.phase == "validation"
         assert len(result.checks) == 1
+
+
+class TestValidatePhaseResult:
+    """Tests for validate_phase_result()."""
+
+    def test_dispatches_to_phase_model(self, sample_discovery_result):
+        """Serialized results are parsed into the phase's model."""
+        raw = json.dumps(sample_discovery_result).encode()
+        result = validate_phase_result("discovery", raw)
+        assert isinstance(result, DiscoveryResult)
+        assert result.usages[0].line == 42
+
+    def test_wrong_phase_payload_fails(self, sample_discovery_result):
+        """A payload for another phase fails validation."""
+        with pytest.raises(ValidationError):
+            validate_phase_result("narrowing", json.dumps(sample_discovery_result))
+
+    def test_unknown_phase_raises(self):
+        """Unknown phases are rejected."""
+        with pytest.raises(KeyError):
+            validate_phase_result("unknown", "{}")
@@ -1,10 +1,16 @@
 """Tests for state management."""
 
 import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
+from migration_harness.schema import NarrowingResult
 from migration_harness.state.manager import StateManager
 
 
@@ -68,3 +74,194 @@ def test_file_persistence(temp_dir, sample_discovery_result):
     result = state_manager2.get_discovery_result()
 
     assert result == sample_discovery_result
+
+
+def test_saved_file_is_readable_json(temp_dir, sample_discovery_result):
+    """State files are compact JSON readable by the stdlib."""
+    sample_discovery_result["usages"][0]["snippet"] = "fetch('/api/v1/usuários')"
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_discovery_result(sample_discovery_result)
+
+    text = (Path(temp_dir) / "discovery-result.json").read_text(encoding="utf-8")
+    assert json.loads(text) == sample_discovery_result
+    assert "\n" not in text
+
+
+def test_pretty_state_files(temp_dir, sample_discovery_result):
+    """pretty=True writes indented JSON."""
+    state_manager = StateManager(work_dir=str(temp_dir), pretty=True)
+    state_manager.save_discovery_result(sample_discovery_result)
+
+    text = (Path(temp_dir) / "discovery-result.json").read_text(encoding="utf-8")
+    assert json.loads(text) == sample_discovery_result
+    assert text.startswith('{\n  "')
+
+
+def test_pretty_per_result(temp_dir, sample_discovery_result):
+    """save_result(pretty=...) overrides the instance setting for one result."""
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_result("discovery", sample_discovery_result, pretty=True)
+    state_manager.save_result("narrowing", {"phase": "narrowing", "narrowed_usages": []})
+
+    assert (Path(temp_dir) / "discovery-result.json").read_text().startswith('{\n  "')
+    assert "\n" not in (Path(temp_dir) / "narrowing-result.json").read_text()
+
+
+def test_get_result_model(state_manager, sample_narrowed_result):
+    """Stored results can be read back as their phase model."""
+    state_manager.save_narrowing_result(sample_narrowed_result)
+    model = state_manager.get_result_model("narrowing")
+
+    assert isinstance(model, NarrowingResult)
+    assert model.narrowed_usages[0].complexity == "low"
+
+
+def test_get_result_model_missing_returns_none(state_manager):
+    """A phase without a stored result yields None."""
+    assert state_manager.get_result_model("validation") is None
+
+
+def test_get_result_model_invalid_raises(state_manager):
+    """A stored result that doesn't match the model fails validation."""
+    state_manager.save_discovery_result({"phase": "discovery", "usages": []})
+    with pytest.raises(ValidationError):
+        state_manager.get_result_model("discovery")
+
+
+def test_save_replaces_file_without_leftovers(temp_dir, sample_discovery_result):
+    """Saving over an existing result leaves no temporary files behind."""
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_discovery_result({"phase": "discovery", "usages": []})
+    state_manager.save_discovery_result(sample_discovery_result)
+
+    assert state_manager.get_discovery_result() == sample_discovery_result
+    assert [p.name for p in Path(temp_dir).iterdir()] == ["discovery-result.json"]
+
+
+def test_read_after_write_skips_disk(temp_dir, sample_discovery_result, monkeypatch):
+    """A result saved by this instance is read back without touching the file."""
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_discovery_result(sample_discovery_result)
+
+    def fail_read_bytes(self):
+        raise AssertionError("state file was read")
+
+    monkeypatch.setattr(Path, "read_bytes", fail_read_bytes)
+    first = state_manager.get_discovery_result()
+    first["usages"].clear()
+
+    assert first is not sample_discovery_result
+    assert state_manager.get_discovery_result() == sample_discovery_result
+
+
+def test_results_persist_across_instances(temp_dir, sample_discovery_result):
+    """A fresh StateManager reads results saved by another one from disk."""
+    StateManager(work_dir=str(temp_dir)).save_discovery_result(sample_discovery_result)
+
+    assert StateManager(work_dir=str(temp_dir)).get_discovery_result() == sample_discovery_result
+
+
+def test_unchanged_state_file_is_read_once(temp_dir, sample_discovery_result, monkeypatch):
+    """Repeated gets of a file written elsewhere read it only once."""
+    StateManager(work_dir=str(temp_dir)).save_discovery_result(sample_discovery_result)
+    state_manager = StateManager(work_dir=str(temp_dir))
+
+    reads = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    state_manager.get_discovery_result()
+    state_manager.get_discovery_result()
+
+    assert len(reads) == 1
+
+
+def test_external_rewrite_is_picked_up(temp_dir, sample_discovery_result):
+    """A state file replaced by another writer is re-read."""
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_discovery_result({"phase": "discovery", "usages": []})
+
+    StateManager(work_dir=str(temp_dir)).save_discovery_result(sample_discovery_result)
+
+    assert state_manager.get_discovery_result() == sample_discovery_result
+
+
+@pytest.mark.slow
+def test_state_modules_do_not_import_pydantic():
+    """State persistence and the tool registry load without pydantic models."""
+    script = (
+        "import sys\n"
+        "import migration_harness.state.manager\n"
+        "import migration_harness.state.progress\n"
+        "import migration_harness.tools.registry\n"
+        "assert 'migration_harness.schema' not in sys.modules\n"
+        "assert 'pydantic' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, env=env)
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_work_dir_is_created_once(tmp_path, monkeypatch):
+    """Components sharing a work dir only create it once."""
+    work_dir = tmp_path / "shared"
+    calls = []
+    original_mkdir = Path.mkdir
+    monkeypatch.setattr(
+        Path, "mkdir", lambda self, *a, **kw: calls.append(self) or original_mkdir(self, *a, **kw)
+    )
+
+    StateManager(work_dir=str(work_dir))
+    StateManager(work_dir=str(work_dir))
+
+    assert work_dir.is_dir()
+    assert calls == [work_dir]
+
+
+def test_concurrent_saves_do_not_collide(temp_dir, sample_discovery_result):
+    """Writers saving the same phase at once each use their own temp file."""
+    results = [
+        {**sample_discovery_result, "timestamp": f"2025-01-01T00:00:{i:02d}Z"} for i in range(8)
+    ]
+
+    def save_repeatedly(result):
+        state_manager = StateManager(work_dir=str(temp_dir))
+        for _ in range(25):
+            state_manager.save_discovery_result(result)
+
+    with ThreadPoolExecutor(max_workers=len(results)) as pool:
+        list(pool.map(save_repeatedly, results))
+
+    assert StateManager(work_dir=str(temp_dir)).get_discovery_result() in results
+    assert [p.name for p in Path(temp_dir).iterdir()] == ["discovery-result.json"]
+
+
+def test_failed_save_removes_temp_file(temp_dir, sample_discovery_result, monkeypatch):
+    """A save that fails before the rename leaves no temp file behind."""
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        StateManager(work_dir=str(temp_dir)).save_discovery_result(sample_discovery_result)
+
+    assert list(Path(temp_dir).iterdir()) == []
+
+
+def test_same_size_rewrite_in_same_mtime_tick_is_picked_up(temp_dir):
+    """A replaced state file is re-read even if its size and mtime match."""
+    state_manager = StateManager(work_dir=str(temp_dir))
+    state_manager.save_discovery_result({"phase": "discovery", "usages": ["a"]})
+    state_file = Path(temp_dir) / "discovery-result.json"
+    mtime_ns = state_file.stat().st_mtime_ns
+
+    StateManager(work_dir=str(temp_dir)).save_discovery_result(
+        {"phase": "discovery", "usages": ["b"]}
+    )
+    os.utime(state_file, ns=(mtime_ns, mtime_ns))
+
+    assert state_manager.get_discovery_result()["usages"] == ["b"]
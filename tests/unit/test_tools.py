@@ -1,6 +1,8 @@
 """Tests for ToolRegistry — the MCP tool bridge."""
 
 import json
+from pathlib import Path
+
 import pytest
 
 from migration_harness.schema import Config
@@ -8,11 +10,17 @@ from migration_harness.state.manager import StateManager
 from migration_harness.tools.registry import ToolRegistry
 
 
+@pytest.fixture(scope="module")
+def base_config(_sample_config_raw) -> Config:
+    """Sample Config validated once for the module."""
+    return Config(**_sample_config_raw)
+
+
 @pytest.fixture
-def tool_registry(sample_config, temp_dir) -> ToolRegistry:
+def tool_registry(base_config, temp_dir) -> ToolRegistry:
     """Create a ToolRegistry with sample config and state manager."""
-    sample_config["work_dir"] = str(temp_dir)
-    config = Config(**sample_config)
+    # Deep copy: the frozen model's lists are still shared by a shallow copy
+    config = base_config.model_copy(update={"work_dir": str(temp_dir)}, deep=True)
     state_manager = StateManager(str(temp_dir))
     return ToolRegistry(config, state_manager)
 
@@ -56,6 +64,28 @@ def test_get_mappings_returns_list(tool_registry):
     assert "graphql_field" in mappings["mappings"][0]
 
 
+def test_config_is_dumped_once(tool_registry, monkeypatch):
+    """Config tools reuse one serialized dump instead of re-dumping."""
+    config_dict = tool_registry.get_config()
+
+    def fail_model_dump(self, **kwargs):
+        raise AssertionError("config was dumped again")
+
+    monkeypatch.setattr(type(tool_registry.config), "model_dump", fail_model_dump)
+    assert tool_registry.get_config() == config_dict
+    assert tool_registry.get_endpoints()["endpoints"] == config_dict["rest_endpoints"]
+    assert tool_registry.get_mappings()["mappings"] == config_dict["attribute_mappings"]
+
+
+def test_config_tools_return_independent_copies(tool_registry):
+    """Mutating a returned config dict does not change later results."""
+    tool_registry.get_config()["rest_endpoints"].clear()
+    tool_registry.get_mappings()["mappings"].clear()
+
+    assert len(tool_registry.get_endpoints()["endpoints"]) > 0
+    assert len(tool_registry.get_mappings()["mappings"]) > 0
+
+
 def test_get_graphql_schema_reads_file(tool_registry, temp_dir):
     """get_graphql_schema() reads and returns file contents."""
     schema_path = temp_dir / "schema.graphql"
@@ -63,69 +93,69 @@ def test_get_graphql_schema_reads_file(tool_registry, temp_dir):
     schema_path.write_text(schema_content)
 
     # Update config to point at our test schema
-    tool_registry.config.graphql_schema_path = str(schema_path)
+    tool_registry.config = tool_registry.config.model_copy(
+        update={"graphql_schema_path": str(schema_path)}
+    )
 
     result = tool_registry.get_graphql_schema()
     assert result == schema_content
 
 
-def test_get_graphql_schema_raises_if_missing(tool_registry):
-    """get_graphql_schema() raises FileNotFoundError if file doesn't exist."""
-    tool_registry.config.graphql_schema_path = "/nonexistent/schema.graphql"
-
-    with pytest.raises(FileNotFoundError):
-        tool_registry.get_graphql_schema()
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# T2 — Result persistence tools (save/get round-trip)
-# ══════════════════════════════════════════════════════════════════════════════
-
-def test_save_and_get_discovery_result_roundtrip(tool_registry, sample_discovery_result):
-    """Discovery save/get is a true round-trip — what you save is what you get."""
-    tool_registry.save_discovery_result(sample_discovery_result)
-    retrieved = tool_registry.get_discovery_result()
-
-    assert retrieved == sample_discovery_result
-    assert retrieved["phase"] == "discovery"
+def test_get_graphql_schema_is_cached_until_file_changes(tool_registry, temp_dir, monkeypatch):
+    """get_graphql_schema() reuses the cached content for an unchanged file."""
+    schema_path = temp_dir / "schema.graphql"
+    schema_path.write_text("type Query { user(id: ID!): User }")
+    tool_registry.config = tool_registry.config.model_copy(
+        update={"graphql_schema_path": str(schema_path)}
+    )
+    first = tool_registry.get_graphql_schema()
 
+    reads = []
+    original_read_bytes = Path.read_bytes
 
-def test_save_and_get_narrowing_result_roundtrip(tool_registry, sample_narrowed_result):
-    """Narrowing save/get is a true round-trip."""
-    tool_registry.save_narrowing_result(sample_narrowed_result)
-    retrieved = tool_registry.get_narrowing_result()
+    def counting_read_bytes(self):
+        reads.append(self)
+        return original_read_bytes(self)
 
-    assert retrieved == sample_narrowed_result
-    assert retrieved["phase"] == "narrowing"
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    assert tool_registry.get_graphql_schema() is first
+    assert reads == []
 
+    schema_path.write_text("type Query { users: [User] }")
+    assert tool_registry.get_graphql_schema() == "type Query { users: [User] }"
+    assert len(reads) == 1
 
-def test_save_and_get_generation_result_roundtrip(tool_registry, sample_generated_result):
-    """Generation save/get is a true round-trip."""
-    tool_registry.save_generation_result(sample_generated_result)
-    retrieved = tool_registry.get_generation_result()
 
-    assert retrieved == sample_generated_result
-    assert retrieved["phase"] == "generation"
+def test_get_graphql_schema_is_decoded_as_utf8(tool_registry, temp_dir):
+    """The schema is returned verbatim as UTF-8, whatever the locale."""
+    schema = '"Benutzer — user"\r\ntype User { name: String }\r\n'
+    schema_path = temp_dir / "schema.graphql"
+    schema_path.write_bytes(schema.encode("utf-8"))
+    tool_registry.config = tool_registry.config.model_copy(
+        update={"graphql_schema_path": str(schema_path)}
+    )
 
+    assert tool_registry.get_graphql_schema() == schema
 
-def test_get_result_returns_none_if_never_saved(tool_registry):
-    """get_*_result() returns None if save was never called, not error."""
-    result = tool_registry.get_discovery_result()
-    assert result is None
 
+def test_get_graphql_schema_raises_if_missing(tool_registry):
+    """get_graphql_schema() raises FileNotFoundError if file doesn't exist."""
+    tool_registry.config = tool_registry.config.model_copy(
+        update={"graphql_schema_path": "/nonexistent/schema.graphql"}
+    )
 
-def test_save_returns_confirmation(tool_registry, sample_discovery_result):
-    """save_*_result() returns a confirmation dict with status."""
-    response = tool_registry.save_discovery_result(sample_discovery_result)
+    with pytest.raises(FileNotFoundError):
+        tool_registry.get_graphql_schema()
 
-    assert isinstance(response, dict)
-    assert response["status"] == "saved"
-    assert response["phase"] == "discovery"
 
+# ══════════════════════════════════════════════════════════════════════════════
+# T2 — Result persistence tools (save/get round-trip)
+# ══════════════════════════════════════════════════════════════════════════════
 
-def test_migration_result_save_and_get(tool_registry):
-    """Migration results persist correctly."""
-    migration_result = {
+@pytest.fixture
+def migration_result():
+    """Migration phase result with one applied migration."""
+    return {
         "phase": "migration",
         "timestamp": "2025-01-01T00:00:00Z",
         "applied_migrations": [
@@ -140,25 +170,62 @@ def test_migration_result_save_and_get(tool_registry):
             }
         ],
     }
-    tool_registry.save_migration_result(migration_result)
-    retrieved = tool_registry.get_migration_result()
 
-    assert retrieved == migration_result
 
-
-def test_validation_result_save_and_get(tool_registry):
-    """Validation results persist correctly."""
-    validation_result = {
+@pytest.fixture
+def validation_result():
+    """Validation phase result with one passing check."""
+    return {
         "phase": "validation",
         "timestamp": "2025-01-01T00:00:00Z",
         "checks": [
             {"check_name": "build", "passed": True, "details": "Build successful"}
         ],
     }
-    tool_registry.save_validation_result(validation_result)
-    retrieved = tool_registry.get_validation_result()
 
-    assert retrieved == validation_result
+
+@pytest.mark.parametrize(
+    "phase,fixture_name",
+    [
+        ("discovery", "sample_discovery_result"),
+        ("narrowing", "sample_narrowed_result"),
+        ("generation", "sample_generated_result"),
+        ("migration", "migration_result"),
+        ("validation", "validation_result"),
+    ],
+)
+def test_save_and_get_roundtrip(tool_registry, phase, fixture_name, request):
+    """Each phase's save/get is a true round-trip — what you save is what you get."""
+    result = request.getfixturevalue(fixture_name)
+    getattr(tool_registry, f"save_{phase}_result")(result)
+    retrieved = getattr(tool_registry, f"get_{phase}_result")()
+
+    assert retrieved == result
+    assert retrieved["phase"] == phase
+
+
+def test_get_result_returns_none_if_never_saved(tool_registry):
+    """get_*_result() returns None if save was never called, not error."""
+    result = tool_registry.get_discovery_result()
+    assert result is None
+
+
+def test_save_returns_confirmation(tool_registry, sample_discovery_result):
+    """save_*_result() returns a confirmation dict with status."""
+    response = tool_registry.save_discovery_result(sample_discovery_result)
+
+    assert isinstance(response, dict)
+    assert response["status"] == "saved"
+    assert response["phase"] == "discovery"
+
+
+def test_generic_save_and_get_match_named_tools(tool_registry, sample_narrowed_result):
+    """save_result()/get_result() are what the named per-phase tools use."""
+    response = tool_registry.save_result("narrowing", sample_narrowed_result)
+
+    assert response == {"status": "saved", "phase": "narrowing"}
+    assert tool_registry.get_narrowing_result() == sample_narrowed_result
+    assert tool_registry.get_result("narrowing") == sample_narrowed_result
 
 
 # ══════════════════════════════════════════════════════════════════════════════